@@ -0,0 +1,220 @@
+import csv
+import io
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+import plant_backend
+
+# Histogram of each plant's average days between waterings: (lower bound, label)
+INTERVAL_BINS = [(0, "0-2 days"), (3, "3-6 days"), (7, "7-13 days"), (14, "14-20 days"),
+                 (21, "21-29 days"), (30, "30-59 days"), (60, "60+ days")]
+
+# Report sections grouping plants by a field
+GROUP_SECTIONS = ["light_intensity", "light_type", "humidity_band", "acquired_month"]
+
+def interval_bin(average_interval):
+    """Return the histogram label for an average watering interval."""
+    if average_interval is None:
+        return "Not enough data"
+    label = INTERVAL_BINS[0][1]
+    for lower, bin_label in INTERVAL_BINS:
+        if average_interval >= lower:
+            label = bin_label
+    return label
+
+# ====== Group Aggregates ======
+# Each group keeps counts, the interval sum, and a Counter of intervals rounded
+# to 0.1 day for the median; all of them add up when partials are merged.
+
+def _new_group():
+    return {"plants": 0, "overdue": 0, "never_watered": 0, "interval_count": 0,
+            "interval_sum": 0.0, "intervals": Counter()}
+
+def _apply_group(group, contribution, sign):
+    interval, overdue, never_watered, _ = contribution
+    group["plants"] += sign
+    group["overdue"] += sign * overdue
+    group["never_watered"] += sign * never_watered
+    if interval is not None:
+        group["interval_count"] += sign
+        group["interval_sum"] += sign * interval
+        key = round(interval, 1)
+        group["intervals"][key] += sign
+        if not group["intervals"][key]:
+            del group["intervals"][key]
+
+def _merge_group(target, group):
+    for key in ("plants", "overdue", "never_watered", "interval_count", "interval_sum"):
+        target[key] += group[key]
+    target["intervals"].update(group["intervals"])
+
+def _median(intervals):
+    """Median of a Counter of interval values."""
+    total = sum(intervals.values())
+    if not total:
+        return None
+    lower_index, upper_index = (total - 1) // 2, total // 2
+    lower = None
+    seen = 0
+    for value in sorted(intervals):
+        seen += intervals[value]
+        if lower is None and seen > lower_index:
+            lower = value
+        if seen > upper_index:
+            return (lower + value) / 2
+
+def _group_report(group):
+    return {
+        "plants": group["plants"],
+        "overdue": group["overdue"],
+        "never_watered": group["never_watered"],
+        "mean_interval": group["interval_sum"] / group["interval_count"] if group["interval_count"] else None,
+        "median_interval": _median(group["intervals"]),
+        "overdue_rate": group["overdue"] / group["plants"] if group["plants"] else None
+    }
+
+class CollectionAnalytics:
+    """
+    Mergeable aggregates over a plant collection: totals, an interval histogram and
+    per-group (light intensity, light type, humidity band, acquisition month)
+    statistics. Partials built with add() over different plants combine with merge().
+    Plants added with update() are tracked, so update()/discard() keep a live
+    report fresh as waterings arrive. Median intervals are to the nearest 0.1 day.
+    """
+    def __init__(self, today=None):
+        self.today = today or date.today()
+        self.total = _new_group()
+        self.histogram = Counter()
+        self.groups = {section: {} for section in GROUP_SECTIONS}
+        self.tracked = {}  # common_name -> contribution, only for plants added with update()
+
+    def _contribution(self, info):
+        stats = plant_backend.plant_watering_stats(info, self.today)
+        overdue = stats["overdue_days"] is not None and stats["overdue_days"] >= 0
+        acquired = info.get("date_acquired")
+        keys = {
+            "light_intensity": info.get("light_intensity") or "Unknown",
+            "light_type": info.get("light_type") or "Unknown",
+            "humidity_band": plant_backend.humidity_band(info.get("min_humidity")),
+            "acquired_month": acquired[:7] if acquired else "Unknown"
+        }
+        return stats["average_interval"], overdue, not info.get("last_watered"), keys
+
+    def _apply(self, contribution, sign):
+        _apply_group(self.total, contribution, sign)
+        label = interval_bin(contribution[0])
+        self.histogram[label] += sign
+        if not self.histogram[label]:
+            del self.histogram[label]
+        for section, key in contribution[3].items():
+            group = self.groups[section].setdefault(key, _new_group())
+            _apply_group(group, contribution, sign)
+            if not group["plants"]:
+                del self.groups[section][key]
+
+    def add(self, info):
+        """Count one plant without tracking it (for partials that are only merged)."""
+        self._apply(self._contribution(info), 1)
+
+    def update(self, common_name, info):
+        """Add a tracked plant, or replace its previous contribution."""
+        self.discard(common_name)
+        contribution = self.tracked[common_name] = self._contribution(info)
+        self._apply(contribution, 1)
+
+    def discard(self, common_name):
+        contribution = self.tracked.pop(common_name, None)
+        if contribution is not None:
+            self._apply(contribution, -1)
+
+    def on_plant_event(self, event, common_name, info):
+        """plant_backend.subscribe() callback."""
+        if event == "removed":
+            self.discard(common_name)
+        else:
+            self.update(common_name, info)
+
+    def merge(self, other):
+        """Add another partial's aggregates; the two must cover different plants."""
+        _merge_group(self.total, other.total)
+        self.histogram.update(other.histogram)
+        for section, groups in other.groups.items():
+            for key, group in groups.items():
+                _merge_group(self.groups[section].setdefault(key, _new_group()), group)
+        self.tracked.update(other.tracked)
+        return self
+
+    def report(self):
+        """Return the analytics report as a JSON-friendly dictionary."""
+        report = {"date": self.today.strftime("%Y-%m-%d")}
+        report.update(_group_report(self.total))
+        report["interval_histogram"] = {
+            label: self.histogram[label]
+            for label in [label for _, label in INTERVAL_BINS] + ["Not enough data"]
+            if self.histogram[label]
+        }
+        for section, groups in self.groups.items():
+            report[section] = {key: _group_report(group) for key, group in sorted(groups.items())}
+        return report
+
+def analyze(plants, today=None, track=False):
+    """
+    Walk the collection once and return its CollectionAnalytics. Pass track=True
+    to keep it up to date afterwards with update()/discard().
+    """
+    analytics = CollectionAnalytics(today)
+    for name, info in plants.items():
+        if track:
+            analytics.update(name, info)
+        else:
+            analytics.add(info)
+    return analytics
+
+def map_partials(function, jobs, today, max_workers=None):
+    """
+    Run function(job, today) for every job, in worker processes when there is more
+    than one, and return the results in order (e.g. CollectionAnalytics to merge).
+    """
+    if len(jobs) < 2 or max_workers == 1:
+        return [function(job, today) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(function, jobs, [today] * len(jobs)))
+
+def analyze_chunk(items, today=None):
+    """Untracked analytics for one chunk of (common_name, info) pairs."""
+    analytics = CollectionAnalytics(today)
+    for _, info in items:
+        analytics.add(info)
+    return analytics
+
+def analyze_parallel(plants, chunk_size=50000, max_workers=None, today=None):
+    """Analyze a large collection in chunks across processes and merge the partials."""
+    today = today or date.today()
+    items = list(plants.items())
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    analytics = CollectionAnalytics(today)
+    for partial in map_partials(analyze_chunk, chunks, today, max_workers):
+        analytics.merge(partial)
+    return analytics
+
+def report_csv(report):
+    """Flatten an analytics report into CSV text (section, group, plants, ...)."""
+    columns = ["plants", "overdue", "never_watered", "mean_interval", "median_interval", "overdue_rate"]
+    formats = {"mean_interval": "{:.2f}", "median_interval": "{:.1f}", "overdue_rate": "{:.3f}"}
+
+    def row(section, key, group):
+        return [section, key] + [
+            "" if group[column] is None else formats.get(column, "{}").format(group[column])
+            for column in columns
+        ]
+
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(["section", "group"] + columns)
+    writer.writerow(row("total", "", report))
+    for label, count in report["interval_histogram"].items():
+        writer.writerow(["interval_histogram", label, count] + [""] * (len(columns) - 1))
+    for section in GROUP_SECTIONS:
+        for key, group in report[section].items():
+            writer.writerow(row(section, key, group))
+    return output.getvalue()
@@ -1,44 +1,233 @@
+import gzip
 import json
-from datetime import datetime, timedelta
+import lzma
+import os
+import zlib
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, timedelta, timezone
 
 DATA_FILE = "plants.json"
 
-def load_plants():
+# Storage presets: indentation (None = minified JSON) and stdlib compression
+STORAGE_PRESETS = {
+    "readable": {"indent": 4, "compression": None, "level": None},
+    "compact": {"indent": None, "compression": None, "level": None},
+    "fast": {"indent": None, "compression": "zlib", "level": 1},
+    "balanced": {"indent": None, "compression": "gzip", "level": 6},
+    "small": {"indent": None, "compression": "lzma", "level": 9}
+}
+DEFAULT_PRESET = "readable"
+
+# Preset detected for each file on load, so saving keeps the file's format
+_file_presets = {}
+
+def _detect_preset(data):
+    """Guess the storage preset of raw file bytes from their magic bytes."""
+    if data[:2] == b"\x1f\x8b":
+        return "balanced"
+    if data[:6] == b"\xfd7zXZ\x00":
+        return "small"
+    if len(data) >= 2 and data[0] == 0x78 and (data[0] * 256 + data[1]) % 31 == 0:
+        return "fast"
+    return "readable" if data[1:2].isspace() or data[:2] == b"{}" else "compact"
+
+def _decompress(data, compression):
+    """Decompress file bytes; corrupt or truncated data raises ValueError."""
     try:
-        with open(DATA_FILE, "r") as f:
-            return json.load(f)
+        if compression == "gzip":
+            return gzip.decompress(data)
+        if compression == "lzma":
+            return lzma.decompress(data)
+        if compression == "zlib":
+            return zlib.decompress(data)
+    except (OSError, EOFError, zlib.error, lzma.LZMAError) as e:
+        raise ValueError(f"Corrupt {compression} data: {e}")
+    return data
+
+def _compress(data, compression, level):
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if compression == "lzma":
+        return lzma.compress(data, preset=level)
+    if compression == "zlib":
+        return zlib.compress(data, level)
+    return data
+
+def read_plants(path):
+    """Read a plants file in any storage preset (detected from its magic bytes)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    preset = _detect_preset(data)
+    _file_presets[path] = preset
+    return json.loads(_decompress(data, STORAGE_PRESETS[preset]["compression"]).decode("utf-8"))
+
+def load_plants(path=None):
+    try:
+        plants = read_plants(path or DATA_FILE)
     except FileNotFoundError:
         return {}  # no file yet, return empty dict
+    repair_plants(plants)
+    return plants
+
+class PlantSerializer:
+    """
+    Encode a plants dictionary exactly like json.dump(plants, f, indent=4) (or
+    minified JSON with indent=None), caching each plant's encoded fragment. Only
+    plants marked dirty (or replaced by a new dictionary object) are re-encoded
+    on the next save.
+    """
+    def __init__(self, indent=4):
+        self.indent = indent
+        self.fragments = {}  # common_name -> (plant info object, encoded '"name": {...}' entry)
+        self.dirty = set()
+
+    def mark_dirty(self, common_name):
+        self.dirty.add(common_name)
+
+    def _encode_entry(self, name, info):
+        if self.indent is None:
+            return f"{json.dumps(name)}:{json.dumps(info, separators=(',', ':'))}"
+        pad = " " * self.indent
+        encoded = json.dumps(info, indent=self.indent).replace("\n", "\n" + pad)
+        return f"{pad}{json.dumps(name)}: {encoded}"
+
+    def encode(self, plants):
+        if not plants:
+            return "{}"
+
+        fragments = self.fragments
+        dirty = self.dirty
+        parts = []
+        for name, info in plants.items():
+            cached = fragments.get(name)
+            if cached is None or cached[0] is not info or name in dirty:
+                cached = fragments[name] = (info, self._encode_entry(name, info))
+            parts.append(cached[1])
+
+        # Drop fragments of removed plants
+        if len(fragments) > len(plants):
+            self.fragments = {name: fragments[name] for name in plants}
+        dirty.clear()
+        if self.indent is None:
+            return "{" + ",".join(parts) + "}"
+        return "{\n" + ",\n".join(parts) + "\n}"
+
+# One fragment cache per (file, indentation), so collections never share fragments
+_serializers = {}
+
+def mark_dirty(common_name):
+    """Flag a plant whose entry was changed in place so the next save re-encodes it."""
+    for serializer in _serializers.values():
+        serializer.mark_dirty(common_name)
+
+def write_plants(plants, path, preset=None):
+    """
+    Write plants to `path` using a storage preset (see STORAGE_PRESETS).
+    Without a preset, the format the file was loaded in is kept.
+    """
+    preset = preset or _file_presets.get(path, DEFAULT_PRESET)
+    if preset not in STORAGE_PRESETS:
+        raise ValueError(f"Unknown storage preset: {preset}")
+
+    options = STORAGE_PRESETS[preset]
+    key = (path, options["indent"])
+    if key not in _serializers:
+        _serializers[key] = PlantSerializer(options["indent"])
+    text = _serializers[key].encode(plants)
+    data = _compress(text.encode("utf-8"), options["compression"], options["level"])
+    with open(path, "wb") as f:
+        f.write(data)
+    _file_presets[path] = preset
+
+def save_plants(plants, path=None, preset=None):
+    path = path or DATA_FILE
+    write_plants(plants, path, preset)
+    if _pending_tombstones.get(path):
+        save_tombstones(_pending_tombstones.pop(path), path)
+
+# ====== Modification Stamps & Tombstones ======
+# Every field edit stamps the plant's 'modified' field (waterings and compaction are
+# merged as history and leave it alone); removals leave a tombstone in a
+# '<collection file>.tombstones' sidecar so sync can tell deletions from additions.
+_pending_tombstones = {}  # collection path -> {common_name: stamp}, written on save
+
+def modification_stamp():
+    """Return a UTC timestamp string that sorts chronologically."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+def record_tombstone(common_name, path=None, stamp=None):
+    """Remember that a plant was removed; written next to the collection on save."""
+    _pending_tombstones.setdefault(path or DATA_FILE, {})[common_name] = stamp or modification_stamp()
+
+def tombstone_path(path=None):
+    return (path or DATA_FILE) + ".tombstones"
+
+def load_tombstones(path=None):
+    """Return {common_name: removal stamp} for a collection, including unsaved removals."""
+    try:
+        with open(tombstone_path(path), "r") as f:
+            tombstones = json.load(f)
+    except FileNotFoundError:
+        tombstones = {}
+    tombstones.update(_pending_tombstones.get(path or DATA_FILE, {}))
+    return tombstones
+
+def save_tombstones(tombstones, path=None):
+    """Merge tombstones into the collection's sidecar file (newest stamp wins)."""
+    merged = load_tombstones(path)
+    for name, stamp in tombstones.items():
+        merged[name] = max(merged.get(name, ""), stamp)
+    with open(tombstone_path(path), "w") as f:
+        json.dump(merged, f, indent=4)
+
+# ====== Change Notifications ======
+# Events: "added", "updated", "watered", "removed"
+_listeners = []
+
+def subscribe(callback):
+    """Call `callback(event, common_name, info)` after every plant change."""
+    if callback not in _listeners:
+        _listeners.append(callback)
 
-def save_plants(plants):
-    with open(DATA_FILE, "w") as f:
-        json.dump(plants, f, indent=4)
+def unsubscribe(callback):
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+def notify_listeners(event, common_name, info=None):
+    """Tell subscribers about a plant change (`info` is None for removals)."""
+    for callback in list(_listeners):
+        callback(event, common_name, info)
 
 # Fixed Options
 VALID_LIGHT_INTENSITY = ["Low", "Low-Medium", "Medium", "Medium-High", "High"]
 VALID_LIGHT_TYPE = ["Direct", "Indirect"]
 
-def add_plant_gui(plants, plant_data):
+# Editable plant fields (everything else is watering data)
+PLANT_FIELDS = ("scientific_name", "date_acquired", "light_intensity", "light_type", "min_humidity", "notes")
+
+def add_plant_gui(plants, plant_data, save=True, path=None):
     """
     Add a plant from a dictionary. If the plant already exists (same common name),
-    update its information instead of adding a duplicate.
+    update the fields present in `plant_data` instead of adding a duplicate.
     `plant_data` should include keys:
         common_name, scientific_name, date_acquired,
         light_intensity, light_type, min_humidity, notes
+    Pass save=False to batch several changes into a single save_plants call,
+    and `path` to save to a collection file other than DATA_FILE.
     """
     common_name = plant_data.get("common_name", "").strip().upper()
     if not common_name:
         raise ValueError("Common name is required")
 
     if common_name in plants:
-        # Update existing plant
+        # Update existing plant: only the fields given in plant_data change
         plant = plants[common_name]
-        plant["scientific_name"] = plant_data.get("scientific_name")
-        plant["date_acquired"] = plant_data.get("date_acquired")
-        plant["light_intensity"] = plant_data.get("light_intensity")
-        plant["light_type"] = plant_data.get("light_type")
-        plant["min_humidity"] = plant_data.get("min_humidity")
-        plant["notes"] = plant_data.get("notes")
+        for field in PLANT_FIELDS:
+            if field in plant_data:
+                plant[field] = plant_data[field]
+        plant["modified"] = modification_stamp()
+        mark_dirty(common_name)
+        event = "updated"
     else:
         # Add new plant
         plants[common_name] = {
@@ -49,15 +238,19 @@ def add_plant_gui(plants, plant_data):
             "light_intensity": plant_data.get("light_intensity"),
             "light_type": plant_data.get("light_type"),
             "min_humidity": plant_data.get("min_humidity"),
-            "notes": plant_data.get("notes")
+            "notes": plant_data.get("notes"),
+            "modified": modification_stamp()
         }
+        event = "added"
 
     # Keep dictionary sorted alphabetically
     plants = dict(sorted(plants.items(), key=lambda p: p[0].lower()))
-    save_plants(plants)
+    if save:
+        save_plants(plants, path)
+    notify_listeners(event, common_name, plants[common_name])
     return plants
 
-def water_plant_gui(plants, common_name):
+def water_plant_gui(plants, common_name, save=True, path=None):
     """ 
     Mark a plant as watered: Updates the 'last_watered' field and appends to watering history.
     Returns updated plants dictionary.
@@ -67,45 +260,456 @@ def water_plant_gui(plants, common_name):
         raise ValueError(f"{common_name} not found.")
 
     today = datetime.now().strftime("%Y-%m-%d")
-    plants[common_name]["last_watered"] = today
-    plants[common_name]["watering_history"].append(today)
+    plant = plants[common_name]
+    history = plant["watering_history"]
+
+    # History stays sorted and free of duplicates (watering twice a day counts once)
+    if not history or history[-1] < today:
+        history.append(today)
+    elif today not in history:
+        insort(history, today)
+    plant["last_watered"] = max(plant["last_watered"] or today, today)
+    mark_dirty(common_name)
 
-    save_plants(plants)
+    if save:
+        save_plants(plants, path)
+    notify_listeners("watered", common_name, plant)
     return plants
 
-def show_average_watering_gui(plants, common_name):
-    """ Return the average days between waterings as a string """
+def remove_plant_gui(plants, common_name, save=True, path=None):
+    """Remove a plant. Returns updated plants dictionary."""
+    common_name = common_name.strip().upper()
+    if common_name not in plants:
+        raise ValueError(f"{common_name} not found.")
+
+    del plants[common_name]
+    record_tombstone(common_name, path)
+    if save:
+        save_plants(plants, path)
+    notify_listeners("removed", common_name)
+    return plants
+
+def import_plants(plants, other, save=True, path=None):
+    """
+    Merge another plants dictionary into `plants`. New plants are added,
+    existing ones get their fields updated and watering histories unioned.
+    Returns updated plants dictionary.
+    """
+    if not isinstance(other, dict):
+        raise ValueError("Imported plants must be a JSON object of plant records.")
+    for name, info in other.items():
+        if not isinstance(info, dict):
+            raise ValueError(f"Imported plant {name} is not a plant record.")
+        if not isinstance(info.get("watering_history") or [], list):
+            raise ValueError(f"Imported plant {name} has an invalid watering_history.")
+
+    events = {}
+    for name, info in other.items():
+        name = name.strip().upper()
+        if not name:
+            continue
+        history = info.get("watering_history") or []
+        events[name] = "updated" if name in plants else "added"
+        if name in plants:
+            plant = plants[name]
+            history = sorted(set(plant["watering_history"]) | set(history))
+            plant.update({k: v for k, v in info.items() if k not in ("watering_history", "watering_archive", "last_watered", "modified")})
+        else:
+            plant = plants[name] = {
+                "scientific_name": info.get("scientific_name"),
+                "date_acquired": info.get("date_acquired"),
+                "last_watered": None,
+                "watering_history": [],
+                "light_intensity": info.get("light_intensity"),
+                "light_type": info.get("light_type"),
+                "min_humidity": info.get("min_humidity"),
+                "notes": info.get("notes")
+            }
+            if info.get("watering_archive"):
+                plant["watering_archive"] = info["watering_archive"]
+        plant["watering_history"] = sorted(set(history))
+        plant["last_watered"] = max(filter(None, [plant["last_watered"], info.get("last_watered")]), default=None)
+        plant["modified"] = modification_stamp()
+        mark_dirty(name)
+
+    repair_plants(plants)
+    plants = dict(sorted(plants.items(), key=lambda p: p[0].lower()))
+    if save:
+        save_plants(plants, path)
+    for name, event in events.items():
+        notify_listeners(event, name, plants[name])
+    return plants
+
+def repair_plants(plants):
+    """
+    Integrity pass: make every 'watering_history' sorted and deduplicated and
+    keep 'last_watered' in line with it. Returns the names of repaired plants.
+    """
+    repaired = []
+    for name, info in plants.items():
+        history = info.get("watering_history")
+        fixed = False
+        if history is None:
+            info["watering_history"] = history = []
+            fixed = True
+        elif any(a >= b for a, b in zip(history, history[1:])):
+            info["watering_history"] = history = sorted(set(history))
+            fixed = True
+
+        if history and (not info.get("last_watered") or info["last_watered"] < history[-1]):
+            info["last_watered"] = history[-1]
+            fixed = True
+
+        if fixed:
+            repaired.append(name)
+            mark_dirty(name)
+    return repaired
+
+def parse_date(date_str):
+    """Parse a YYYY-MM-DD string into a date, or None if missing/invalid."""
+    if not date_str:
+        return None
+    try:
+        return date.fromisoformat(date_str)
+    except (ValueError, TypeError):
+        return None
+
+def plant_watering_stats(info, today=None):
+    """
+    Return a record of watering statistics for a single plant entry:
+        average_interval: average days between waterings (None if < 2 waterings)
+        next_due: predicted next watering date (None if unknown)
+        overdue_days: days past next_due, negative while not yet due (None if unknown)
+        history_length: number of recorded waterings, including compacted ones
+    """
+    today = today or date.today()
+    history = info.get("watering_history") or []
+    archive = info.get("watering_archive") or []
+    count = len(history) + sum(bucket["count"] for bucket in archive)
+
+    average = None
+    if count >= 2:
+        # Consecutive differences telescope, so only the endpoints need parsing.
+        # Compacted buckets keep their first/last dates, so this stays exact.
+        first = parse_date(archive[0]["first"] if archive else history[0])
+        last = parse_date(history[-1] if history else archive[-1]["last"])
+        if first and last:
+            average = (last - first).days / (count - 1)
+
+    next_due = None
+    overdue_days = None
+    last_watered = parse_date(info.get("last_watered"))
+    if last_watered and average is not None:
+        next_due = last_watered + timedelta(days=round(average))
+        overdue_days = (today - next_due).days
+
+    return {
+        "average_interval": average,
+        "next_due": next_due,
+        "overdue_days": overdue_days,
+        "history_length": count
+    }
+
+def watering_stats(plants, common_name, today=None):
+    """Return the watering statistics record for one plant."""
+    common_name = common_name.strip().upper()
+    if common_name not in plants:
+        raise ValueError(f"{common_name} not found.")
+    return plant_watering_stats(plants[common_name], today)
+
+def watering_stats_all(plants, today=None):
+    """Return a dictionary of watering statistics records for every plant."""
+    today = today or date.today()
+    return {name: plant_watering_stats(info, today) for name, info in plants.items()}
+
+HUMIDITY_BANDS = [(0.3, "< 30%"), (0.5, "30-50%"), (0.7, "50-70%"), (float("inf"), ">= 70%")]
+
+def humidity_band(min_humidity):
+    """Return the humidity band label of a 'min_humidity' value (0-1)."""
+    if min_humidity is None:
+        return "Unknown"
+    for upper, label in HUMIDITY_BANDS:
+        if min_humidity < upper:
+            return label
+
+def stats_json(stats):
+    """Return a JSON-friendly copy of a watering statistics record."""
+    next_due = stats["next_due"]
+    return dict(stats, next_due=next_due.strftime("%Y-%m-%d") if next_due else None)
+
+# ====== History Compaction ======
+def _new_bucket(period, date_str):
+    return {
+        "period": period,
+        "count": 0,
+        "interval_sum": 0,
+        "min_interval": None,
+        "max_interval": None,
+        "first": date_str,
+        "last": date_str
+    }
+
+def _merge_bucket(target, bucket):
+    """Fold `bucket` into `target`; `bucket` must cover later dates than `target`."""
+    target["count"] += bucket["count"]
+    target["interval_sum"] += bucket["interval_sum"]
+    for key, pick in (("min_interval", min), ("max_interval", max)):
+        values = [v for v in (target[key], bucket[key]) if v is not None]
+        target[key] = pick(values) if values else None
+    target["last"] = bucket["last"]
+
+def _fold_dates(archive, dates):
+    """Append sorted raw `dates` to the monthly buckets at the end of `archive`."""
+    prev = parse_date(archive[-1]["last"]) if archive else None
+    for date_str in dates:
+        current = parse_date(date_str)
+        if not archive or not date_str.startswith(archive[-1]["period"]):
+            archive.append(_new_bucket(date_str[:7], date_str))
+        bucket = archive[-1]
+        bucket["count"] += 1
+        bucket["last"] = date_str
+        if prev is not None:
+            # Each interval belongs to the bucket of the watering that ends it
+            interval = (current - prev).days
+            bucket["interval_sum"] += interval
+            bucket["min_interval"] = interval if bucket["min_interval"] is None else min(bucket["min_interval"], interval)
+            bucket["max_interval"] = interval if bucket["max_interval"] is None else max(bucket["max_interval"], interval)
+        prev = current
+
+def _roll_up_years(archive, cutoff_period):
+    """Merge monthly buckets older than `cutoff_period` (YYYY-MM) into yearly buckets."""
+    rolled = []
+    for bucket in archive:
+        period = bucket["period"]
+        if len(period) == 7 and period < cutoff_period:
+            period = period[:4]
+        if rolled and rolled[-1]["period"] == period:
+            _merge_bucket(rolled[-1], bucket)
+        else:
+            rolled.append(dict(bucket, period=period))
+    return rolled
+
+def archive_path(path=None):
+    """Raw history archive next to a collection (plants.json -> plants_archive.json)."""
+    root, ext = os.path.splitext(path or DATA_FILE)
+    return f"{root}_archive{ext}"
+
+def load_archive(archive_file=None, path=None):
+    """Return the raw watering history archive ({common_name: [dates]}) of a collection."""
+    archive_file = archive_file or archive_path(path)
+    try:
+        with open(archive_file, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def _save_archive(archived, archive_file):
+    """Merge newly compacted raw dates into the archive file."""
+    archive = load_archive(archive_file)
+    for name, dates in archived.items():
+        archive[name] = sorted(set(archive.get(name, [])) | set(dates))
+    with open(archive_file, "w") as f:
+        json.dump(archive, f)
+
+def load_full_history(plants, common_name, archive_file=None, path=None):
+    """
+    Return the full raw watering history of a plant, reading compacted dates
+    back from the archive file on demand.
+    """
+    common_name = common_name.strip().upper()
+    if common_name not in plants:
+        raise ValueError(f"{common_name} not found.")
+
+    history = plants[common_name]["watering_history"]
+    if not plants[common_name].get("watering_archive"):
+        return list(history)
+    archived = load_archive(archive_file, path).get(common_name, [])
+    return sorted(set(archived) | set(history))
+
+def compact_history(plants, keep_days=365, monthly_days=3 * 365, archive_file=None, today=None, save=True, path=None,
+                    keep_raw=False):
+    """
+    Fold watering history older than `keep_days` into per-month aggregate buckets
+    (stored in the plant's 'watering_archive'), and months older than `monthly_days`
+    into per-year buckets. With `keep_raw` (or an explicit `archive_file`) the raw
+    dates are kept in the collection's archive file (see archive_path).
+    Returns updated plants dictionary.
+    """
+    if monthly_days < keep_days:
+        raise ValueError("monthly_days must be at least keep_days.")
+
+    today = today or date.today()
+    cutoff = (today - timedelta(days=keep_days)).isoformat()
+    month_cutoff = (today - timedelta(days=monthly_days)).isoformat()[:7]
+
+    archived = {}
+    compacted = []
+    for name, info in plants.items():
+        history = sorted(info.get("watering_history") or [])
+        split = bisect_left(history, cutoff)
+        archive = info.get("watering_archive") or []
+        if not split and not archive:
+            continue
+
+        _fold_dates(archive, history[:split])
+        rolled = _roll_up_years(archive, month_cutoff)
+        if not split and rolled == archive:
+            continue  # nothing new to fold or roll up, leave the record untouched
+        info["watering_archive"] = rolled
+        info["watering_history"] = history[split:]
+        mark_dirty(name)
+        compacted.append(name)
+        if split:
+            archived[name] = history[:split]
+
+    if (keep_raw or archive_file) and archived:
+        _save_archive(archived, archive_file or archive_path(path))
+
+    if save:
+        save_plants(plants, path)
+    for name in compacted:
+        notify_listeners("updated", name, plants[name])
+    return plants
+
+# ====== Date Range Queries ======
+def _to_date(value):
+    """Accept a date or a YYYY-MM-DD string."""
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+def waterings_between(plants, common_name, start, end):
+    """
+    Return the raw watering dates of a plant between `start` and `end` (inclusive).
+    ISO date strings order exactly like their ordinals, so the sorted history
+    is bisected directly without parsing every entry.
+    """
     common_name = common_name.strip().upper()
     if common_name not in plants:
         raise ValueError(f"{common_name} not found.")
 
     history = plants[common_name]["watering_history"]
+    lo = bisect_left(history, _to_date(start).isoformat())
+    hi = bisect_right(history, _to_date(end).isoformat())
+    return history[lo:hi]
+
+def count_waterings_between(plants, start, end):
+    """Return {common_name: number of waterings} between `start` and `end` (inclusive)."""
+    start, end = _to_date(start).isoformat(), _to_date(end).isoformat()
+    counts = {}
+    for name, info in plants.items():
+        history = info["watering_history"]
+        count = bisect_right(history, end) - bisect_left(history, start)
+        if count:
+            counts[name] = count
+    return counts
+
+class WateringIndex:
+    """
+    Global date -> plants index over raw watering history. Days are kept as a
+    sorted list of ordinals so day and range lookups are binary searches.
+    Dates folded into compacted buckets (compact_history) are not indexed.
+    Subscribe on_plant_event to keep the index current as plants change.
+    """
+    def __init__(self, plants=None):
+        by_day = {}
+        for name, info in (plants or {}).items():
+            for date_str in info.get("watering_history", []):
+                by_day.setdefault(date.fromisoformat(date_str).toordinal(), []).append(name)
+        self.days = sorted(by_day)
+        self.names = [sorted(by_day[day]) for day in self.days]
+
+    def add(self, common_name, day):
+        """Record a single watering (e.g. right after water_plant_gui)."""
+        ordinal = _to_date(day).toordinal()
+        i = bisect_left(self.days, ordinal)
+        if i < len(self.days) and self.days[i] == ordinal:
+            if common_name not in self.names[i]:
+                insort(self.names[i], common_name)
+        else:
+            self.days.insert(i, ordinal)
+            self.names.insert(i, [common_name])
+
+    def discard_plant(self, common_name):
+        """Forget every watering of a removed plant."""
+        for i in reversed(range(len(self.days))):
+            if common_name in self.names[i]:
+                self.names[i].remove(common_name)
+                if not self.names[i]:
+                    del self.days[i], self.names[i]
 
-    if len(history) < 2:
+    def on_plant_event(self, event, common_name, info):
+        """plant_backend.subscribe() callback."""
+        if event != "watered":
+            # Edits, additions and compaction can drop dates; reindex the plant
+            self.discard_plant(common_name)
+        if event != "removed":
+            for date_str in info.get("watering_history", []):
+                self.add(common_name, date_str)
+
+    def plants_on(self, day):
+        """Return the plants watered on a given day."""
+        ordinal = _to_date(day).toordinal()
+        i = bisect_left(self.days, ordinal)
+        if i < len(self.days) and self.days[i] == ordinal:
+            return list(self.names[i])
+        return []
+
+    def between(self, start, end):
+        """Return [(date, [plants])] for every day with activity in [start, end]."""
+        lo = bisect_left(self.days, _to_date(start).toordinal())
+        hi = bisect_right(self.days, _to_date(end).toordinal())
+        return [(date.fromordinal(self.days[i]), list(self.names[i])) for i in range(lo, hi)]
+
+    def week_activity(self, day):
+        """Return {date: [plants]} for the Monday-Sunday week containing `day`."""
+        monday = _to_date(day) - timedelta(days=_to_date(day).weekday())
+        return dict(self.between(monday, monday + timedelta(days=6)))
+
+def activity_report(plants, start=None, end=None, index=None):
+    """
+    Return the raw waterings between `start` and `end` (inclusive; by default the
+    Monday-Sunday week of today) as {"start", "end", "days": [{"date", "plants"}],
+    "counts": {common_name: waterings}}. Pass a maintained WateringIndex to reuse it.
+    """
+    if start is None and end is None:
+        start = date.today() - timedelta(days=date.today().weekday())
+    start = _to_date(start) if start is not None else _to_date(end) - timedelta(days=6)
+    end = _to_date(end) if end is not None else start + timedelta(days=6)
+    index = index if index is not None else WateringIndex(plants)
+    return {
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "days": [{"date": day.isoformat(), "plants": names} for day, names in index.between(start, end)],
+        "counts": count_waterings_between(plants, start, end)
+    }
+
+def show_average_watering_gui(plants, common_name):
+    """ Return the average days between waterings as a string """
+    common_name = common_name.strip().upper()
+    stats = watering_stats(plants, common_name)
+
+    if stats["average_interval"] is None:
         return f"🔴 {common_name}: Not enough watering data to calculate an average yet."
 
-    # Convert to datetime objects
-    dates = [datetime.strptime(d, "%Y-%m-%d") for d in history]
-    differences = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
+    return f"📊 {common_name}: Average days between watering: {stats['average_interval']:.1f}"
 
-    average_days = sum(differences) / len(differences)
-    return f"📊 {common_name}: Average days between watering: {average_days:.1f}"
+def show_plant_gui(name, info):
+    """Return the formatted block for a single plant"""
+    return (
+        f"🍃 {name} ({info['scientific_name']})\n"
+        f"   Date acquired: {info['date_acquired']}\n"
+        f"   Last watered: {info['last_watered']}\n"
+        f"   Light intensity: {info['light_intensity']}\n"
+        f"   Light type: {info['light_type']}\n"
+        f"   Minimum humidity: {info['min_humidity']}\n"
+        f"   Notes: {info['notes']}\n\n"
+    )
 
 def show_all_plants_gui(plants):
     """Return a formatted string of all plants"""
     if not plants:
         return "No plants added yet.\n"
 
-    result = ""
-    for name, info in plants.items():
-        result += f"🍃 {name} ({info['scientific_name']})\n"
-        result += f"   Date acquired: {info['date_acquired']}\n"
-        result += f"   Last watered: {info['last_watered']}\n"
-        result += f"   Light intensity: {info['light_intensity']}\n"
-        result += f"   Light type: {info['light_type']}\n"
-        result += f"   Minimum humidity: {info['min_humidity']}\n"
-        result += f"   Notes: {info['notes']}\n\n"
-    return result
+    return "".join(show_plant_gui(name, info) for name, info in plants.items())
 
 def sort_plants_gui(plants, sort_by="common_name", reverse=False):
     """Return a sorted list of (name, info) tuples based on selected field."""
@@ -131,27 +735,16 @@ def sort_plants_gui(plants, sort_by="common_name", reverse=False):
             except Exception:
                 return datetime.min
         elif sort_by == "needs_watering":
-            today = datetime.now()
-            try:
-                last = datetime.strptime(info.get("last_watered", ""), "%Y-%m-%d")
-            except Exception:
-                return datetime.min  # never watered = lowest priority
-
-            # Compute average interval if data exists
-            history = info.get("watering_history", [])
-            if len(history) >= 2:
-                dates = [datetime.strptime(d, "%Y-%m-%d") for d in history]
-                diffs = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-                avg = sum(diffs) / len(diffs)
-                next_date = last + timedelta(days=avg)
-            else:
-                # if not enough data, treat as not needing watering soon
-                next_date = datetime.max
-
-            # earlier next_date = higher priority (so we sort by next_date)
-            return next_date
+            if not info.get("last_watered"):
+                return date.min  # never watered = lowest priority
+
+            # earlier next_due = higher priority (so we sort by next_due);
+            # if not enough data, treat as not needing watering soon
+            next_due = stats[name]["next_due"]
+            return next_due if next_due else date.max
         else:
             return name.lower()
 
+    stats = watering_stats_all(plants) if sort_by == "needs_watering" else None
     sorted_list = sorted(plants.items(), key=get_key, reverse=reverse)
     return sorted_list
@@ -0,0 +1,113 @@
+from datetime import date
+import plant_backend
+
+def ewma_interval(info, alpha):
+    """
+    Return the exponentially weighted average days between waterings
+    (recent intervals weigh more with a larger alpha), or None if < 2 waterings.
+    """
+    history = info.get("watering_history") or []
+    archive = info.get("watering_archive") or []
+
+    # Compacted history only keeps sums, so its mean seeds the weighted average
+    archived_count = sum(bucket["count"] for bucket in archive)
+    weighted = None
+    if archived_count >= 2:
+        weighted = sum(bucket["interval_sum"] for bucket in archive) / (archived_count - 1)
+
+    dates = [plant_backend.parse_date(d) for d in history]
+    if archive and dates:
+        dates.insert(0, plant_backend.parse_date(archive[-1]["last"]))
+    for prev, current in zip(dates, dates[1:]):
+        interval = (current - prev).days
+        weighted = interval if weighted is None else alpha * interval + (1 - alpha) * weighted
+    return weighted
+
+class WateringForecast:
+    """
+    Projected watering calendar for the whole collection over the next `days` days.
+    Built in one pass over the plants and kept up to date per plant with update().
+    """
+    def __init__(self, plants, days=14, alpha=None, today=None):
+        if days < 1:
+            raise ValueError("days must be at least 1.")
+        if alpha is not None and not 0 < alpha <= 1:
+            raise ValueError("alpha must be between 0 and 1.")
+        self.days = days
+        self.alpha = alpha
+        self.refresh(plants, today)
+
+    def refresh(self, plants, today=None):
+        """Recompute the whole forecast (e.g. once a day when the date rolls over)."""
+        self.plants = plants
+        self.today = today or date.today()
+        self._calendar = None
+        self.start = self.today.toordinal()
+        self.end = self.start + self.days - 1
+        self.schedule = {}
+        self.by_day = {day: set() for day in range(self.start, self.end + 1)}
+        for name, info in plants.items():
+            self._schedule(name, info)
+
+    def _interval(self, info):
+        if self.alpha is None:
+            return plant_backend.plant_watering_stats(info, self.today)["average_interval"]
+        return ewma_interval(info, self.alpha)
+
+    def _schedule(self, name, info):
+        interval = self._interval(info)
+        last_watered = plant_backend.parse_date(info.get("last_watered"))
+        if interval is None or last_watered is None:
+            return
+
+        step = max(1, round(interval))
+        # Overdue plants are due today, then every interval after that
+        day = max(last_watered.toordinal() + step, self.start)
+        projected = []
+        while day <= self.end:
+            projected.append(day)
+            self.by_day[day].add(name)
+            day += step
+        if projected:
+            self.schedule[name] = projected
+
+    def update(self, common_name, plants=None):
+        """
+        Reproject a single plant after it was watered, edited, added or removed.
+        Pass `plants` when the collection dictionary itself was replaced.
+        """
+        if plants is not None:
+            self.plants = plants
+        common_name = common_name.strip().upper()
+        self._reproject(common_name, self.plants.get(common_name))
+
+    def on_plant_event(self, event, common_name, info):
+        """plant_backend.subscribe() callback (uses the event's record, not self.plants)."""
+        self._reproject(common_name, None if event == "removed" else info)
+
+    def _reproject(self, common_name, info):
+        self._calendar = None
+        for day in self.schedule.pop(common_name, []):
+            self.by_day[day].discard(common_name)
+        if info is not None:
+            self._schedule(common_name, info)
+
+    def due_on(self, day):
+        """Return the sorted plants projected to need watering on `day`."""
+        return sorted(self.by_day.get(day.toordinal(), ()))
+
+    def calendar(self):
+        """Return the per-day workload: [{"date", "count", "plants"}] over the horizon."""
+        if self._calendar is None:
+            self._calendar = self._build_calendar()
+        return self._calendar
+
+    def _build_calendar(self):
+        return [
+            {
+                "date": date.fromordinal(day).strftime("%Y-%m-%d"),
+                "count": len(self.by_day[day]),
+                "plants": sorted(self.by_day[day])
+            }
+            for day in range(self.start, self.end + 1)
+        ]
@@ -0,0 +1,43 @@
+from datetime import date
+import plant_analytics
+import plant_backend
+
+def analyze_file(path, today=None):
+    """
+    Load one collection file and return its untracked CollectionAnalytics,
+    or an error message string if the file could not be read.
+    """
+    try:
+        plants = plant_backend.read_plants(path)
+    except (OSError, ValueError) as e:
+        return str(e)
+    plant_backend.repair_plants(plants)
+    return plant_analytics.analyze(plants, today)
+
+def summarize_collection(path, today=None):
+    """
+    Summarize one collection file: totals (overdue, never watered, mean and median
+    interval), the interval histogram, and light/humidity/acquisition breakdowns.
+    """
+    analytics = analyze_file(path, today)
+    if isinstance(analytics, str):
+        return {"path": path, "error": analytics}
+    return dict(path=path, **analytics.report())
+
+def report_collections(paths, max_workers=None):
+    """
+    Analyze many collection files in parallel worker processes and merge their
+    aggregates. Returns {"collections": [per-file reports], "total": merged report}.
+    """
+    today = date.today()
+    total = plant_analytics.CollectionAnalytics(today)
+    collections = []
+    for path, analytics in zip(paths, plant_analytics.map_partials(analyze_file, paths, today, max_workers)):
+        if isinstance(analytics, str):
+            # Files that failed to load are reported but left out of the total
+            collections.append({"path": path, "error": analytics})
+            continue
+        collections.append(dict(path=path, **analytics.report()))
+        total.merge(analytics)
+
+    return {"collections": collections, "total": total.report()}
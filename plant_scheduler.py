@@ -0,0 +1,201 @@
+import argparse
+import heapq
+import itertools
+import os
+import threading
+import time
+from datetime import datetime, time as clock_time, timedelta
+import plant_backend
+
+# ====== Notification Sinks ======
+# A sink is any callable taking (common_name, next_due date)
+
+def stdout_sink(common_name, next_due):
+    print(f"💧 {common_name} needs watering (due {next_due.strftime('%Y-%m-%d')})", flush=True)
+
+class LogFileSink:
+    """Append reminders to a log file."""
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, common_name, next_due):
+        stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with open(self.path, "a") as f:
+            f.write(f"{stamp} {common_name} needs watering (due {next_due.strftime('%Y-%m-%d')})\n")
+
+class TkPopupSink:
+    """
+    List reminders in one non-modal window on a Tk root (safe to call from the
+    scheduler thread). Reminders arriving together are shown together, and later
+    ones are added to the same window while it stays open.
+    """
+    def __init__(self, root):
+        self.root = root
+        self._pending = []
+        self._lock = threading.Lock()
+        self._window = None
+        self._listbox = None
+
+    def __call__(self, common_name, next_due):
+        with self._lock:
+            self._pending.append(f"💧 {common_name} needs watering (due {next_due.strftime('%Y-%m-%d')})")
+            if len(self._pending) > 1:
+                return  # already queued to show
+        self.root.after(0, self._show)
+
+    def _show(self):
+        import tkinter as tk
+        with self._lock:
+            lines, self._pending = self._pending, []
+        if self._window is None or not self._window.winfo_exists():
+            self._window = tk.Toplevel(self.root)
+            self._window.title("Watering reminders")
+            self._listbox = tk.Listbox(self._window, width=60, height=15)
+            scrollbar = tk.Scrollbar(self._window, command=self._listbox.yview)
+            self._listbox.configure(yscrollcommand=scrollbar.set)
+            tk.Button(self._window, text="Close", command=self._window.destroy).pack(side="bottom", pady=5)
+            scrollbar.pack(side="right", fill="y")
+            self._listbox.pack(side="left", fill="both", expand=True)
+        self._listbox.insert("end", *lines)
+        self._listbox.see("end")
+        self._window.deiconify()
+        self._window.lift()
+
+# ====== Scheduler ======
+class ReminderScheduler(threading.Thread):
+    """
+    Background thread keeping every plant in a heap keyed by its predicted due time.
+    It sleeps until the earliest plant comes due, notifies the sink, and is woken
+    early only when a plant is rescheduled (e.g. watered). Plants that stay
+    unwatered are reminded again every `repeat_days`. With a `path`, the file is
+    checked for changes at least every `poll_seconds`.
+    """
+    def __init__(self, plants, sink=stdout_sink, remind_at=clock_time(9, 0), repeat_days=1, path=None,
+                 poll_seconds=60):
+        super().__init__(name="plant-reminders", daemon=True)
+        self.sink = sink
+        self.remind_at = remind_at
+        self.repeat = timedelta(days=repeat_days) if repeat_days else None
+        self.path = path  # when set, pick up changes other processes saved to this file
+        self.poll_seconds = poll_seconds
+        self._mtime = self._file_mtime()
+        self._plants = plants
+        self._heap = []  # (due timestamp, sequence, common_name, version, next_due)
+        self._versions = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._stopped = False
+        for name, info in plants.items():
+            self._schedule(name, info)
+
+    def _file_mtime(self):
+        try:
+            return os.path.getmtime(self.path) if self.path else None
+        except OSError:
+            return None
+
+    def _schedule(self, common_name, info):
+        """Push a plant's next reminder; older heap entries become stale. Caller holds the lock."""
+        version = self._versions[common_name] = self._versions.get(common_name, 0) + 1
+        if info is None:
+            return
+        next_due = plant_backend.plant_watering_stats(info)["next_due"]
+        if next_due is None:
+            return
+        due = datetime.combine(next_due, self.remind_at).timestamp()
+        heapq.heappush(self._heap, (due, next(self._sequence), common_name, version, next_due))
+
+    def reschedule(self, common_name, info=None):
+        """Reschedule one plant (pass info=None when it was removed) and wake the thread."""
+        with self._condition:
+            self._schedule(common_name, info)
+            self._condition.notify()
+
+    def on_plant_event(self, event, common_name, info):
+        """plant_backend.subscribe() callback."""
+        self.reschedule(common_name, None if event == "removed" else info)
+
+    def _reload_if_changed(self):
+        """
+        Reschedule plants whose watering data changed in the file. Caller holds the lock.
+        Returns True if the file was reloaded.
+        """
+        mtime = self._file_mtime()
+        if mtime is None or mtime == self._mtime:
+            return False
+        self._mtime = mtime
+        plants = plant_backend.load_plants(self.path)
+        for name in self._plants.keys() - plants.keys():
+            self._schedule(name, None)
+        for name, info in plants.items():
+            old = self._plants.get(name)
+            if old is None or (old.get("last_watered"), old.get("watering_history")) != (
+                    info.get("last_watered"), info.get("watering_history")):
+                self._schedule(name, info)
+        self._plants = plants
+        return True
+
+    def run(self):
+        while True:
+            with self._condition:
+                # Collect every reminder due at this wake-up so sinks can group them
+                due_entries = []
+                while not self._stopped:
+                    if self.path and not due_entries:
+                        self._reload_if_changed()
+                    # Skip entries superseded by a reschedule
+                    while self._heap and self._heap[0][3] != self._versions.get(self._heap[0][2]):
+                        heapq.heappop(self._heap)
+                    if self._heap and self._heap[0][0] <= time.time():
+                        due_entry = heapq.heappop(self._heap)
+                        due_entries.append(due_entry)
+                        if self.repeat:
+                            # Remind again at the next repeat after now (long-overdue plants fire once)
+                            due, _, name, version, next_due = due_entry
+                            step = self.repeat.total_seconds()
+                            due += step * (int((time.time() - due) // step) + 1)
+                            heapq.heappush(self._heap, (due, next(self._sequence), name, version, next_due))
+                        continue
+                    if due_entries:
+                        break
+                    # Watching a file, never sleep past the next poll
+                    timeout = self.poll_seconds if self.path else None
+                    if not self._heap:
+                        self._condition.wait(timeout=timeout)
+                        continue
+                    delay = self._heap[0][0] - time.time()
+                    self._condition.wait(timeout=min(delay, timeout) if timeout else delay)
+                if self._stopped:
+                    return
+            # Notify outside the lock so a slow sink never blocks rescheduling
+            for _, _, name, _, next_due in due_entries:
+                self.sink(name, next_due)
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+def run_daemon(path=None, log=None, remind_at=clock_time(9, 0)):
+    """Run reminders in the foreground until interrupted."""
+    sink = LogFileSink(log) if log else stdout_sink
+    path = path or plant_backend.DATA_FILE
+    scheduler = ReminderScheduler(plant_backend.load_plants(path), sink, remind_at, path=path)
+    scheduler.start()
+    try:
+        while scheduler.is_alive():
+            scheduler.join(timeout=3600)
+    except KeyboardInterrupt:
+        scheduler.stop()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless watering reminder daemon.")
+    parser.add_argument("--file", help=f"plants collection file (default: {plant_backend.DATA_FILE})")
+    parser.add_argument("--log", help="append reminders to this file instead of printing them")
+    parser.add_argument("--at", default="09:00", help="time of day to send reminders (HH:MM)")
+    args = parser.parse_args(argv)
+
+    run_daemon(args.file, args.log, datetime.strptime(args.at, "%H:%M").time())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+import argparse
+import asyncio
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import date
+import plant_analytics
+import plant_backend
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+class PlantServer:
+    """
+    Local HTTP/JSON server owning one in-memory plant collection. Requests are
+    served from memory; changes are batched into one save after `flush_delay` seconds.
+    """
+    def __init__(self, path=None, host=DEFAULT_HOST, port=DEFAULT_PORT, flush_delay=1.0):
+        self.path = path
+        self.host = host
+        self.port = port
+        self.flush_delay = flush_delay
+        self.plants = plant_backend.load_plants(path)
+        self._plants_body = None  # cached encoding of GET /plants
+        self._analytics = None  # kept current per changed plant; rebuilt when the date rolls over
+        self._index = None  # WateringIndex for /activity, kept current per changed plant
+        self._flush_task = None
+        self._server = None
+
+    # ====== Persistence ======
+    def _changed(self, common_name):
+        """Invalidate cached responses and schedule a batched save."""
+        self._plants_body = None
+        if self._index is not None:
+            info = self.plants.get(common_name)
+            self._index.on_plant_event("updated" if info is not None else "removed", common_name, info)
+        if self._analytics is not None:
+            if common_name in self.plants:
+                self._analytics.update(common_name, self.plants[common_name])
+            else:
+                self._analytics.discard(common_name)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_delay)
+        self.flush()
+
+    def flush(self):
+        plant_backend.save_plants(self.plants, self.path)
+
+    # ====== Routing ======
+    def handle(self, method, path, query, body):
+        """Dispatch one request. Returns (status, JSON-able result) or (status, bytes)."""
+        parts = [urllib.parse.unquote(p) for p in path.strip("/").split("/") if p]
+
+        if parts == ["plants"]:
+            if method == "GET":
+                if self._plants_body is None:
+                    self._plants_body = json.dumps(self.plants).encode("utf-8")
+                return 200, self._plants_body
+            if method == "POST":
+                if not isinstance(body, dict):
+                    raise ValueError("Request body must be a JSON object.")
+                self.plants = plant_backend.add_plant_gui(self.plants, body, save=False, path=self.path)
+                name = body["common_name"].strip().upper()
+                self._changed(name)
+                return 200, {"common_name": name, "plant": self.plants[name]}
+
+        elif len(parts) == 2 and parts[0] == "plants":
+            name = parts[1].strip().upper()
+            if method == "GET":
+                if name not in self.plants:
+                    return 404, {"error": f"{name} not found."}
+                return 200, {"common_name": name, "plant": self.plants[name]}
+            if method == "DELETE":
+                plant_backend.remove_plant_gui(self.plants, name, save=False, path=self.path)
+                self._changed(name)
+                return 200, {"common_name": name}
+
+        elif len(parts) == 3 and parts[0] == "plants" and parts[2] == "water" and method == "POST":
+            name = parts[1].strip().upper()
+            plant_backend.water_plant_gui(self.plants, name, save=False, path=self.path)
+            self._changed(name)
+            return 200, {"common_name": name, "plant": self.plants[name]}
+
+        elif parts == ["sort"] and method == "GET":
+            sorted_list = plant_backend.sort_plants_gui(
+                self.plants,
+                sort_by=query.get("by", "common_name"),
+                reverse=query.get("reverse") in ("1", "true")
+            )
+            if "limit" in query:
+                sorted_list = sorted_list[:int(query["limit"])]
+            return 200, [dict(info, common_name=name) for name, info in sorted_list]
+
+        elif parts == ["stats"] and method == "GET":
+            if "name" in query:
+                return 200, plant_backend.stats_json(plant_backend.watering_stats(self.plants, query["name"]))
+            all_stats = plant_backend.watering_stats_all(self.plants)
+            return 200, {name: plant_backend.stats_json(stats) for name, stats in all_stats.items()}
+
+        elif parts == ["due"] and method == "GET":
+            today = date.today()
+            all_stats = plant_backend.watering_stats_all(self.plants, today)
+            due = [
+                dict(plant_backend.stats_json(stats), common_name=name)
+                for name, stats in all_stats.items()
+                if stats["overdue_days"] is not None and stats["overdue_days"] >= 0
+            ]
+            due.sort(key=lambda d: d["next_due"])
+            return 200, due
+
+        elif parts == ["activity"] and method == "GET":
+            if self._index is None:
+                self._index = plant_backend.WateringIndex(self.plants)
+            return 200, plant_backend.activity_report(
+                self.plants, query.get("start"), query.get("end"), index=self._index
+            )
+
+        elif parts == ["analytics"] and method == "GET":
+            if self._analytics is None or self._analytics.today != date.today():
+                self._analytics = plant_analytics.analyze(self.plants, track=True)
+            return 200, self._analytics.report()
+
+        elif parts == ["flush"] and method == "POST":
+            self.flush()
+            return 200, {"saved": len(self.plants)}
+
+        else:
+            return 404, {"error": f"Unknown path: {path}"}
+
+        return 405, {"error": f"{method} not allowed on {path}"}
+
+    # ====== HTTP ======
+    @staticmethod
+    def _response(status, result, keep_alive):
+        payload = result if isinstance(result, bytes) else json.dumps(result).encode("utf-8")
+        return (
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1")
+            + payload
+        )
+
+    async def _serve_client(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+
+                lines = head.decode("latin-1").split("\r\n")
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        key, value = line.split(":", 1)
+                        headers[key.strip().lower()] = value.strip()
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    # The rest of the stream can't be framed; answer and hang up
+                    writer.write(self._response(400, {"error": "Malformed request."}, keep_alive=False))
+                    await writer.drain()
+                    break
+
+                raw_body = await reader.readexactly(length) if length else b""
+
+                url = urllib.parse.urlsplit(target)
+                query = dict(urllib.parse.parse_qsl(url.query))
+                try:
+                    body = json.loads(raw_body) if raw_body else None
+                    status, result = self.handle(method, url.path, query, body)
+                except ValueError as e:
+                    status, result = 400, {"error": str(e)}
+                except (KeyError, TypeError, AttributeError) as e:
+                    status, result = 400, {"error": f"Bad request: {e}"}
+
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                writer.write(self._response(status, result, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve_client, self.host, self.port)
+        # Port 0 picks a free port; report the real one
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self._server
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            self.flush()
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"🌱 Plant server listening on http://{self.host}:{self.port}")
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+class PlantClient:
+    """
+    Talks to a PlantServer with the same function names as plant_backend, so it
+    can stand in for the backend wherever plants are loaded or changed. The
+    `save` and `path` arguments are accepted for compatibility; the server owns
+    its collection file. Changes made through the client notify the local
+    plant_backend subscribers just like backend changes do.
+    """
+    def __init__(self, base_url=f"http://{DEFAULT_HOST}:{DEFAULT_PORT}", timeout=5):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def _request(self, method, path, payload=None):
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+        request = urllib.request.Request(
+            self.base_url + path, data=data, method=method,
+            headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.load(response)
+        except urllib.error.HTTPError as e:
+            # Server-side validation errors surface like the backend's ValueErrors
+            raise ValueError(json.load(e).get("error", str(e)))
+
+    @staticmethod
+    def _quote(common_name):
+        return urllib.parse.quote(common_name.strip().upper(), safe="")
+
+    def load_plants(self, path=None):
+        return self._request("GET", "/plants")
+
+    def save_plants(self, plants, path=None, preset=None):
+        """The server owns persistence; ask it to write pending changes now."""
+        self._request("POST", "/flush")
+
+    def add_plant_gui(self, plants, plant_data, save=True, path=None):
+        result = self._request("POST", "/plants", plant_data)
+        name = result["common_name"]
+        event = "updated" if name in plants else "added"
+        plants[name] = result["plant"]
+        plants = dict(sorted(plants.items(), key=lambda p: p[0].lower()))
+        plant_backend.notify_listeners(event, name, plants[name])
+        return plants
+
+    def water_plant_gui(self, plants, common_name, save=True, path=None):
+        result = self._request("POST", f"/plants/{self._quote(common_name)}/water")
+        plants[result["common_name"]] = result["plant"]
+        plant_backend.notify_listeners("watered", result["common_name"], result["plant"])
+        return plants
+
+    def remove_plant_gui(self, plants, common_name, save=True, path=None):
+        result = self._request("DELETE", f"/plants/{self._quote(common_name)}")
+        plants.pop(result["common_name"], None)
+        plant_backend.notify_listeners("removed", result["common_name"])
+        return plants
+
+    def sort_plants(self, sort_by="common_name", reverse=False, limit=None):
+        query = {"by": sort_by, "reverse": "1" if reverse else "0"}
+        if limit is not None:
+            query["limit"] = limit
+        return self._request("GET", "/sort?" + urllib.parse.urlencode(query))
+
+    def watering_stats(self, common_name=None):
+        query = "?" + urllib.parse.urlencode({"name": common_name}) if common_name else ""
+        return self._request("GET", "/stats" + query)
+
+    def due_plants(self):
+        return self._request("GET", "/due")
+
+    def watering_activity(self, start=None, end=None):
+        query = {key: value for key, value in (("start", start), ("end", end)) if value}
+        return self._request("GET", "/activity" + ("?" + urllib.parse.urlencode(query) if query else ""))
+
+    def collection_analytics(self):
+        return self._request("GET", "/analytics")
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the plant collection over local HTTP/JSON.")
+    parser.add_argument("--file", help=f"plants collection file (default: {plant_backend.DATA_FILE})")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--flush-delay", type=float, default=1.0, help="seconds to batch changes before saving")
+    args = parser.parse_args()
+
+    server = PlantServer(args.file, args.host, args.port, args.flush_delay)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import plant_backend
+
+# Fields merged through the history union rather than copied from the newer record
+HISTORY_FIELDS = ("watering_history", "watering_archive", "last_watered", "modified")
+
+DELTA_KEYS = ("added", "changed", "history", "archive", "removed")
+
+def _archived_until(info):
+    """Last date already folded into the plant's compacted buckets ('' if none)."""
+    archive = info.get("watering_archive")
+    return archive[-1]["last"] if archive else ""
+
+def compute_delta(source, target, source_tombstones=None, target_tombstones=None):
+    """
+    Return the changes that bring `target` up to date with `source`:
+        added: full records of plants only `source` has
+        changed: {common_name: fields} where the `source` record is newer
+        history: {common_name: watering dates `target` is missing}
+        archive: {common_name: compacted buckets reaching past `target`'s own}
+        removed: {common_name: stamp} tombstones `target` has not seen
+    Only field edits move a record's 'modified' stamp, so the newer stamp picks the
+    fields while waterings from either side are unioned through `history`.
+    """
+    source_tombstones = source_tombstones or {}
+    target_tombstones = target_tombstones or {}
+    delta = {key: {} for key in DELTA_KEYS}
+
+    for name, info in source.items():
+        stamp = info.get("modified", "")
+        other = target.get(name)
+        if other is None:
+            # Skip plants the target removed after their last change here
+            removed_at = target_tombstones.get(name)
+            if removed_at is None or removed_at < stamp:
+                delta["added"][name] = info
+            continue
+
+        if stamp > other.get("modified", ""):
+            fields = {
+                key: value for key, value in info.items()
+                if key not in HISTORY_FIELDS and other.get(key) != value
+            }
+            fields["modified"] = stamp
+            delta["changed"][name] = fields
+
+        # A further-compacted source replaces the target's buckets; raw dates
+        # up to the end of those buckets are then already counted in them
+        archived_until = _archived_until(other)
+        if _archived_until(info) > archived_until:
+            delta["archive"][name] = info["watering_archive"]
+            archived_until = _archived_until(info)
+        history, other_history = info.get("watering_history", []), other.get("watering_history", [])
+        if history == other_history:
+            continue
+        missing = sorted(d for d in set(history).difference(other_history) if d > archived_until)
+        if missing:
+            delta["history"][name] = missing
+
+    for name, stamp in source_tombstones.items():
+        if target_tombstones.get(name, "") >= stamp:
+            continue
+        if name in target and target[name].get("modified", "") > stamp:
+            continue  # re-added or edited on the target after the removal
+        delta["removed"][name] = stamp
+
+    return delta
+
+def delta_size(delta):
+    """Number of plants a delta touches."""
+    return len(set().union(*(delta.get(key, {}) for key in DELTA_KEYS)))
+
+def apply_delta(plants, delta, save=True, path=None):
+    """
+    Apply a delta from compute_delta to `plants`. Only touched plants are marked
+    dirty, so saving re-encodes just those records. Returns updated plants dictionary.
+    """
+    events = {}
+
+    for name, record in delta["added"].items():
+        plants[name] = dict(record, watering_history=list(record.get("watering_history", [])))
+        events[name] = "added"
+
+    for name, fields in delta["changed"].items():
+        if name in plants:
+            plants[name].update(fields)
+            events.setdefault(name, "updated")
+
+    for name, archive in delta.get("archive", {}).items():
+        if name not in plants or _archived_until(plants[name]) >= archive[-1]["last"]:
+            continue
+        plant = plants[name]
+        plant["watering_archive"] = [dict(bucket) for bucket in archive]
+        plant["watering_history"] = [d for d in plant["watering_history"] if d > archive[-1]["last"]]
+        events.setdefault(name, "updated")
+
+    for name, dates in delta["history"].items():
+        if name not in plants:
+            continue
+        plant = plants[name]
+        plant["watering_history"] = sorted(set(plant["watering_history"]).union(dates))
+        plant["last_watered"] = max(filter(None, [plant.get("last_watered"), dates[-1]]))
+        events.setdefault(name, "watered")
+
+    for name, stamp in delta["removed"].items():
+        if name in plants and plants[name].get("modified", "") <= stamp:
+            del plants[name]
+            events[name] = "removed"
+        plant_backend.record_tombstone(name, path, stamp)
+
+    for name, event in events.items():
+        if event != "removed":
+            plant_backend.mark_dirty(name)
+
+    if delta["added"]:
+        plants = dict(sorted(plants.items(), key=lambda p: p[0].lower()))
+    if save and (events or delta["removed"]):
+        plant_backend.save_plants(plants, path)
+    for name, event in events.items():
+        plant_backend.notify_listeners(event, name, plants.get(name))
+    return plants
+
+def sync_collections(path_a, path_b):
+    """
+    Two-way sync of two collection files. Each side receives only the other's
+    delta and is rewritten only if that delta is not empty.
+    Returns (delta for a, delta for b).
+    """
+    plants_a, plants_b = plant_backend.load_plants(path_a), plant_backend.load_plants(path_b)
+    tombstones_a, tombstones_b = plant_backend.load_tombstones(path_a), plant_backend.load_tombstones(path_b)
+
+    to_a = compute_delta(plants_b, plants_a, tombstones_b, tombstones_a)
+    to_b = compute_delta(plants_a, plants_b, tombstones_a, tombstones_b)
+
+    if delta_size(to_a):
+        apply_delta(plants_a, to_a, path=path_a)
+    if delta_size(to_b):
+        apply_delta(plants_b, to_b, path=path_b)
+    return to_a, to_b
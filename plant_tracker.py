@@ -1,24 +1,26 @@
+import argparse
 import json
+import shlex
+import sys
 from datetime import datetime
+import plant_analytics
+import plant_backend
+import plant_forecast
+import plant_report
+import plant_scheduler
+import plant_sync
 
-DATA_FILE = "plants.json"
+def load_plants(path=None):
+    return plant_backend.load_plants(path)
 
-def load_plants():
-    try:
-        with open(DATA_FILE, "r") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}  # no file yet, return empty dict
-
-def save_plants(plants):
-    with open(DATA_FILE, "w") as f:
-        json.dump(plants, f, indent=4)
+def save_plants(plants, path=None, preset=None):
+    plant_backend.save_plants(plants, path, preset)
 
 # Fixed Options
 VALID_LIGHT_INTENSITY = ["Low", "Low-Medium", "Medium", "Medium-High", "High"]
 VALID_LIGHT_TYPE = ["Direct", "Indirect"]
 
-def add_plant(plants):
+def add_plant(plants, path=None):
     # Common name is required
     common_name = input("Common name (required): ").strip().upper()
     if not common_name:
@@ -81,23 +83,20 @@ def add_plant(plants):
         "light_intensity": light_intensity,
         "light_type": light_type,
         "min_humidity": min_humidity,
-        "notes": notes
+        "notes": notes,
+        "modified": plant_backend.modification_stamp()
     }
 
-    save_plants(plants)
+    save_plants(plants, path)
     print(f"{common_name} added!\n")
 
-def water_plant(plants):
+def water_plant(plants, path=None):
     common_name = input("Which plant did you water? ").strip().upper()
     if common_name not in plants:
         print("Plant not found.")
         return
     
-    today = datetime.now().strftime("%Y-%m-%d")
-    plants[common_name]["last_watered"] = today
-    plants[common_name]["watering_history"].append(today)
-    
-    save_plants(plants)
+    plant_backend.water_plant_gui(plants, common_name, path=path)
     print(f"{common_name} watered today.\n")
 
 def show_average_watering(plants):
@@ -111,23 +110,17 @@ def show_average_watering(plants):
         print("Plant not found.\n")
         return
 
-    history = plants[common_name]["watering_history"]
+    stats = plant_backend.watering_stats(plants, common_name)
 
-    if len(history) < 2:
+    if stats["average_interval"] is None:
         print(f"{common_name}: Not enough watering data to calculate average.\n")
         return
 
-    # Convert string dates to datetime objects
-    dates = [datetime.strptime(d, "%Y-%m-%d") for d in history]
-
-    # Calculate differences between consecutive dates
-    differences = [(dates[i] - dates[i-1]).days for i in range(1, len(dates))]
-
-    # Calculate average
-    average_days = sum(differences) / len(differences)
-
     # (1f formats to 1 decimal place)
-    print(f"{common_name}: Average days between watering = {average_days:.1f}\n")
+    print(f"{common_name}: Average days between watering = {stats['average_interval']:.1f}")
+    if stats["next_due"] is not None:
+        print(f"{common_name}: Next watering = {stats['next_due'].strftime('%Y-%m-%d')}")
+    print()
 
 def show_all_plants(plants):
     if not plants:
@@ -237,7 +230,7 @@ def sort_plants(plants):
               f"Acquired: {info.get('date_acquired')}, Last watered: {info.get('last_watered')})")
     print()
 
-def delete_plant(plants):
+def delete_plant(plants, path=None):
     if not plants:
         print("No plants to delete.\n")
         return
@@ -246,23 +239,24 @@ def delete_plant(plants):
     if common_name in plants:
         confirm = input(f"Are you sure you want to delete {common_name}? (Y/N): ").strip().upper()
         if confirm == "Y":
-            del plants[common_name]
-            save_plants(plants)
+            plant_backend.remove_plant_gui(plants, common_name, path=path)
             print(f"{common_name} has been deleted.\n")
         else:
             print("Deletion canceled.\n")
     else:
         print("Plant not found.\n")
 
-def clean_list(plants):
+def clean_list(plants, path=None):
     if not plants:
         print("No plants to delete.\n")
         return
 
     confirm = input("Are you sure you want to delete ALL plants? (Y/N): ").strip().upper()
     if confirm == "Y":
+        for name in plants:
+            plant_backend.record_tombstone(name, path)
         plants.clear()
-        save_plants(plants)
+        save_plants(plants, path)
         print("All plants have been deleted.\n")
     else:
         print("Deletion canceled.\n")
@@ -283,8 +277,290 @@ def help_menu(plants):
     print("10. Show help menu -> help")
 
 
-def main():
-    plants = load_plants()  # Load existing plants from JSON
+# ====== Batch (non-interactive) mode ======
+SORT_FIELDS = ["common_name", "min_humidity", "light_intensity", "date_acquired", "last_watered", "needs_watering"]
+
+def _humidity(value):
+    humidity = float(value)
+    if not 0 <= humidity <= 1:
+        raise argparse.ArgumentTypeError("humidity must be between 0 and 1")
+    return humidity
+
+def _iso_date(value):
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError("date must be YYYY-MM-DD")
+    return value
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="plant_tracker.py",
+        description="Plant Tracker. Run without a command for the interactive menu."
+    )
+    parser.add_argument("--file", help=f"plants collection file (default: {plant_backend.DATA_FILE})")
+    commands = parser.add_subparsers(dest="command")
+
+    add = commands.add_parser("add", help="add or update a plant")
+    add.add_argument("common_name")
+    add.add_argument("--scientific-name")
+    add.add_argument("--date-acquired", type=_iso_date)
+    add.add_argument("--light-intensity", choices=VALID_LIGHT_INTENSITY)
+    add.add_argument("--light-type", choices=VALID_LIGHT_TYPE)
+    add.add_argument("--min-humidity", type=_humidity)
+    add.add_argument("--notes")
+
+    water = commands.add_parser("water", help="mark plants as watered today")
+    water.add_argument("names", nargs="+")
+
+    remove = commands.add_parser("remove", help="remove plants")
+    remove.add_argument("names", nargs="+")
+
+    sort = commands.add_parser("sort", help="list plants sorted by a field")
+    sort.add_argument("--by", choices=SORT_FIELDS, default="common_name")
+    sort.add_argument("--desc", action="store_true")
+    sort.add_argument("--limit", type=int)
+
+    show = commands.add_parser("show", help="show one plant, or all plants")
+    show.add_argument("name", nargs="?")
+
+    stats = commands.add_parser("stats", help="watering statistics for one plant, or all plants")
+    stats.add_argument("name", nargs="?")
+
+    forecast = commands.add_parser("forecast", help="per-day watering workload for the next days")
+    forecast.add_argument("--days", type=int, default=14)
+    forecast.add_argument("--alpha", type=float, help="weight recent intervals (0-1) instead of the plain mean")
+
+    activity = commands.add_parser("activity", help="plants watered per day between two dates (default: this week)")
+    activity.add_argument("--start", type=_iso_date)
+    activity.add_argument("--end", type=_iso_date)
+
+    analytics = commands.add_parser("analytics", help="interval histogram and per-group watering statistics")
+    analytics.add_argument("--csv", help="also write the report as CSV to this file")
+
+    import_cmd = commands.add_parser("import", help="merge plants from a JSON file")
+    import_cmd.add_argument("path")
+
+    export = commands.add_parser("export", help="write plants to a readable JSON file ('-' for stdout)")
+    export.add_argument("path")
+
+    convert = commands.add_parser("convert", help="rewrite the plants file with a storage preset")
+    convert.add_argument("preset", choices=list(plant_backend.STORAGE_PRESETS))
+    convert.add_argument("--output", help="write to another file instead of converting in place")
+
+    compact = commands.add_parser("compact", help="fold old watering history into aggregates")
+    compact.add_argument("--keep-days", type=int, default=365)
+    compact.add_argument("--keep-raw", action="store_true", help="keep raw dates in the collection's archive file")
+    compact.add_argument("--archive-file", help="keep raw dates in this file instead")
+
+    commands.add_parser("repair", help="sort and deduplicate watering histories")
+
+    report = commands.add_parser("report", help="summarize many collection files in parallel")
+    report.add_argument("paths", nargs="+")
+    report.add_argument("--workers", type=int, help="worker processes (default: one per core)")
+
+    remind = commands.add_parser("remind", help="run the watering reminder daemon in the foreground")
+    remind.add_argument("--log", help="append reminders to this file instead of printing them")
+
+    sync = commands.add_parser("sync", help="two-way merge with another copy of the collection")
+    sync.add_argument("other")
+
+    diff = commands.add_parser("diff", help="print the delta another copy would bring to this collection")
+    diff.add_argument("other")
+
+    apply = commands.add_parser("apply", help="apply a delta file written by 'diff'")
+    apply.add_argument("delta")
+
+    run = commands.add_parser("run", help="run a script of commands ('-' for stdin) with a single save")
+    run.add_argument("script")
+    return parser
+
+def run_command(plants, args):
+    """
+    Run one parsed batch command against the in-memory collection without saving.
+    Returns (plants, result, changed).
+    """
+    command = args.command
+
+    if command == "add":
+        fields = {
+            "scientific_name": args.scientific_name,
+            "date_acquired": args.date_acquired,
+            "light_intensity": args.light_intensity,
+            "light_type": args.light_type,
+            "min_humidity": args.min_humidity,
+            "notes": args.notes
+        }
+        # Updating an existing plant changes only the options that were given
+        plant_data = {key: value for key, value in fields.items() if value is not None}
+        plant_data["common_name"] = args.common_name
+        plants = plant_backend.add_plant_gui(plants, plant_data, save=False, path=args.file)
+        return plants, args.common_name.strip().upper(), True
+
+    if command in ("water", "remove"):
+        # Check every name first so a typo never leaves the command half applied
+        names = list(dict.fromkeys(name.strip().upper() for name in args.names))
+        missing = [name for name in names if name not in plants]
+        if missing:
+            raise ValueError(f"{', '.join(missing)} not found.")
+        change = plant_backend.water_plant_gui if command == "water" else plant_backend.remove_plant_gui
+        for name in names:
+            change(plants, name, save=False, path=args.file)
+        return plants, names, True
+
+    if command == "sort":
+        sorted_list = plant_backend.sort_plants_gui(plants, sort_by=args.by, reverse=args.desc)
+        if args.limit is not None:
+            sorted_list = sorted_list[:args.limit]
+        return plants, [dict(info, common_name=name) for name, info in sorted_list], False
+
+    if command == "show":
+        if args.name is None:
+            return plants, plants, False
+        name = args.name.strip().upper()
+        if name not in plants:
+            raise ValueError(f"{name} not found.")
+        return plants, plants[name], False
+
+    if command == "stats":
+        if args.name is None:
+            all_stats = plant_backend.watering_stats_all(plants)
+            return plants, {name: plant_backend.stats_json(stats) for name, stats in all_stats.items()}, False
+        return plants, plant_backend.stats_json(plant_backend.watering_stats(plants, args.name)), False
+
+    if command == "forecast":
+        forecast = plant_forecast.WateringForecast(plants, days=args.days, alpha=args.alpha)
+        return plants, forecast.calendar(), False
+
+    if command == "activity":
+        return plants, plant_backend.activity_report(plants, args.start, args.end), False
+
+    if command == "analytics":
+        report = plant_analytics.analyze(plants).report()
+        if args.csv:
+            with open(args.csv, "w", newline="") as f:
+                f.write(plant_analytics.report_csv(report))
+        return plants, report, False
+
+    if command == "diff":
+        other = plant_backend.load_plants(args.other)
+        delta = plant_sync.compute_delta(
+            other, plants, plant_backend.load_tombstones(args.other), plant_backend.load_tombstones(args.file)
+        )
+        return plants, delta, False
+
+    if command == "apply":
+        with open(args.delta, "r") as f:
+            delta = json.load(f)
+        # A script's 'diff' output entry can be applied directly
+        delta = delta.get("result", delta)
+        plants = plant_sync.apply_delta(plants, delta, save=False, path=args.file)
+        return plants, plant_sync.delta_size(delta), plant_sync.delta_size(delta) > 0
+
+    if command == "import":
+        other = plant_backend.read_plants(args.path)
+        plants = plant_backend.import_plants(plants, other, save=False, path=args.file)
+        return plants, len(other), True
+
+    if command == "export":
+        if args.path == "-":
+            return plants, plants, False
+        plant_backend.write_plants(plants, args.path, preset="readable")
+        return plants, args.path, False
+
+    if command == "convert":
+        if args.output:
+            plant_backend.write_plants(plants, args.output, preset=args.preset)
+        else:
+            save_plants(plants, args.file, preset=args.preset)
+        return plants, args.preset, False
+
+    if command == "compact":
+        plants = plant_backend.compact_history(
+            plants, keep_days=args.keep_days, archive_file=args.archive_file, save=False, path=args.file,
+            keep_raw=args.keep_raw
+        )
+        return plants, len(plants), True
+
+    if command == "repair":
+        # load_plants already repairs in memory; saving writes the fix back to the file
+        plant_backend.repair_plants(plants)
+        return plants, len(plants), True
+
+    raise ValueError(f"Unknown command: {command}")
+
+def run_batch(argv):
+    """
+    Non-interactive entry point: one load, every command in memory, one save.
+    Prints JSON results and returns the process exit code.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        main(args.file) # (interactive tracker on the chosen file)
+        return 0
+
+    if args.command == "report":
+        print(json.dumps(plant_report.report_collections(args.paths, args.workers), indent=2))
+        return 0
+
+    if args.command == "sync":
+        to_local, to_other = plant_sync.sync_collections(args.file or plant_backend.DATA_FILE, args.other)
+        print(json.dumps({
+            "received": plant_sync.delta_size(to_local),
+            "sent": plant_sync.delta_size(to_other)
+        }, indent=2))
+        return 0
+
+    if args.command == "remind":
+        plant_scheduler.run_daemon(args.file, args.log)
+        return 0
+
+    if args.command == "run":
+        if args.script == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(args.script, "r") as f:
+                lines = f.read().splitlines()
+        # Lines are tokenized one at a time below, so a bad line fails on its own
+        commands = [line for line in lines if line.strip() and not line.lstrip().startswith("#")]
+    else:
+        commands = [argv]
+
+    plants = load_plants(args.file)
+    results = []
+    changed = False
+    for command in commands:
+        scripted = isinstance(command, str)
+        entry = {"command": command.strip() if scripted else " ".join(command)}
+        try:
+            tokens = shlex.split(command, comments=True) if scripted else command
+            command_args = parser.parse_args(tokens)
+            if command_args.command in (None, "run", "report", "remind", "sync"):
+                raise ValueError("Not available inside scripts.")
+            if command_args.file is not None and command_args.file != args.file:
+                raise ValueError("--file is not available inside scripts; pass it before 'run'.")
+            # Every script line works on the collection loaded above
+            command_args.file = args.file
+            plants, entry["result"], command_changed = run_command(plants, command_args)
+            changed = changed or command_changed
+            entry["ok"] = True
+        except SystemExit:
+            entry.update(ok=False, error="invalid command")
+        except (ValueError, OSError) as e:
+            entry.update(ok=False, error=str(e))
+        results.append(entry)
+
+    if changed:
+        save_plants(plants, args.file)
+
+    output = results if args.command == "run" else results[0]
+    print(json.dumps(output, indent=2))
+    return 0 if all(entry["ok"] for entry in results) else 1
+
+def main(path=None):
+    plants = load_plants(path)  # Load existing plants from JSON
     print("-------------------------------------")
     print("| 🌱 Welcome to Plant Tracker!!! 🌱 |")
     print("-------------------------------------")
@@ -295,21 +571,21 @@ def main():
         print()
 
         if choice == "1" or choice == "ADD":
-            add_plant(plants)
+            add_plant(plants, path)
         elif choice == "2" or choice == "SHOW PLANT":
             show_plant(plants)
         elif choice == "3" or choice == "SHOW ALL":
             show_all_plants(plants)
         elif choice == "4" or choice == "WATER":
-            water_plant(plants)
+            water_plant(plants, path)
         elif choice == "5" or choice == "SHOW WATERINGS":
             show_average_watering(plants)
         elif choice == "6" or choice == "SORT":
             sort_plants(plants)
         elif choice == "7" or choice == "REMOVE":
-            delete_plant(plants)
+            delete_plant(plants, path)
         elif choice == "8" or choice == "RESET":
-            clean_list(plants)
+            clean_list(plants, path)
         elif choice == "9" or choice == "EXIT" or choice == "DONE":
             print("Thanks and goodbye!!! 🌻")
             break
@@ -319,4 +595,4 @@ def main():
             print("Invalid choice, please try again.\n")
 
 if __name__ == "__main__":
-    main() # (command line tracker)
\ No newline at end of file
+    sys.exit(run_batch(sys.argv[1:])) # (command line tracker)
\ No newline at end of file
@@ -1,21 +1,27 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime, timedelta
-import re
+from datetime import datetime
 import webbrowser
 import urllib.parse
+import argparse
+from bisect import bisect_left, insort
+import itertools
 import requests
 import plant_backend
+import plant_scheduler
+import plant_server
 
 class PlantApp(tk.Tk):
-    def __init__(self):
+    def __init__(self, server_url=None, data_file=None):
         super().__init__()
         self.title("🌿 Plant Tracker")
         self.geometry("800x675")
         self.configure(bg="#90bd9c")
 
-        # Load plants
-        self.plants = plant_backend.load_plants()
+        # Load plants, either from the file or through a running plant_server
+        self.data_file = data_file
+        self.store = plant_server.PlantClient(server_url) if server_url else plant_backend
+        self.plants = self.store.load_plants(self.data_file)
 
         # Configure Main Window Responsiveness
         self.rowconfigure(1, weight=1)
@@ -48,17 +54,34 @@ class PlantApp(tk.Tk):
             self.frames[F.__name__] = frame
             frame.grid(row=0, column=0, sticky="nsew")
 
+        # Pages render once, then patch themselves from backend change events
+        self.reload_plants(load=False)
+        for frame in self.frames.values():
+            if hasattr(frame, "on_plant_event"):
+                plant_backend.subscribe(frame.on_plant_event)
+
+        # Watering reminders pop up while the window is open
+        self.reminders = plant_scheduler.ReminderScheduler(self.plants, plant_scheduler.TkPopupSink(self))
+        plant_backend.subscribe(self.reminders.on_plant_event)
+        # Start once the event loop runs, so the sink's root.after calls have a loop to land on
+        self.after_idle(self.reminders.start)
+
         self.show_frame("AddPlantPage")
 
     def show_frame(self, page_name):
         """Switch between pages"""
         frame = self.frames[page_name]
-        if page_name == "ShowPlantsPage":
-            frame.refresh_plants()
-        elif page_name == "WaterPlantPage":
-            frame.refresh_dropdown()
         frame.tkraise()
 
+    def reload_plants(self, load=True):
+        """Reload the collection (optionally from disk) and fully redraw every page."""
+        if load:
+            self.plants = self.store.load_plants(self.data_file)
+            for name, info in self.plants.items():
+                self.reminders.reschedule(name, info)
+        self.frames["ShowPlantsPage"].render_all()
+        self.frames["WaterPlantPage"].refresh_dropdown()
+
 # ====== Add Plant Page ======
 class AddPlantPage(ttk.Frame):
     VALID_LIGHT_INTENSITY = ["Low", "Low-Medium", "Medium", "Medium-High", "High"]
@@ -138,8 +161,9 @@ class AddPlantPage(ttk.Frame):
             plant_data["min_humidity"] = None
 
         try:
-            self.controller.plants = plant_backend.add_plant_gui(self.controller.plants, plant_data)
-            plant_backend.save_plants(self.controller.plants)
+            self.controller.plants = self.controller.store.add_plant_gui(
+                self.controller.plants, plant_data, path=self.controller.data_file
+            )
             messagebox.showinfo("Success", f"{plant_data['common_name'].upper()} added!")
             for e in self.entries.values(): e.delete(0, tk.END)
         except ValueError as e:
@@ -154,8 +178,11 @@ class AddPlantPage(ttk.Frame):
             messagebox.showerror("Error", f"{name} not found.")
             return
         if messagebox.askyesno("Confirm", f"Remove {name}?"):
-            self.controller.plants.pop(name)
-            plant_backend.save_plants(self.controller.plants)
+            try:
+                self.controller.store.remove_plant_gui(self.controller.plants, name, path=self.controller.data_file)
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+                return
             self.remove_entry.delete(0, tk.END)
             messagebox.showinfo("Removed", f"{name} removed!")
 
@@ -232,8 +259,7 @@ class WaterPlantPage(ttk.Frame):
         self.wiki_button.pack(anchor="w", pady=10)
 
     def refresh_dropdown(self):
-        """Reload plant names into dropdown and update info."""
-        self.controller.plants = plant_backend.load_plants()
+        """Fill the dropdown with every plant name and update info."""
         plant_names = sorted(self.controller.plants.keys())
         self.dropdown["values"] = plant_names
 
@@ -241,9 +267,30 @@ class WaterPlantPage(ttk.Frame):
             self.dropdown.current(0)
             self.update_display_info()
         else:
-            self.last_watered_label.config(text="🗓️ Last Watered: —")
-            self.avg_label.config(text="📊 Average Interval: —")
-            self.next_water_label.config(text="🌞 Next Watering: —")
+            self.dropdown.set("")
+            self.update_display_info()
+
+    def on_plant_event(self, event, plant_name, info):
+        """Patch the dropdown or the info labels for a single changed plant."""
+        plant_names = list(self.dropdown["values"])
+        selected = self.dropdown.get().strip().upper()
+
+        if event == "added":
+            insort(plant_names, plant_name)
+            self.dropdown["values"] = plant_names
+            if not selected:
+                self.dropdown.set(plant_name)
+                # The controller's plants dictionary is replaced after the event
+                self.after_idle(self.update_display_info)
+        elif event == "removed":
+            if plant_name in plant_names:
+                plant_names.remove(plant_name)
+                self.dropdown["values"] = plant_names
+            if plant_name == selected:
+                self.dropdown.set(plant_names[0] if plant_names else "")
+                self.update_display_info()
+        elif plant_name == selected:
+            self.update_display_info()
 
     def update_display_info(self, event=None):
         """Update watering info for the selected plant."""
@@ -261,32 +308,20 @@ class WaterPlantPage(ttk.Frame):
         last_watered = info.get("last_watered") or "No record"
         self.last_watered_label.config(text=f"🗓️ Last Watered: {last_watered}")
 
-        # Average Interval
-        avg_days = None
-        try:
-            avg_str = plant_backend.show_average_watering_gui(plants, plant_name)
-            match = re.search(r"(\d+(\.\d+)?)", avg_str)  # extract number
-            if match:
-                avg_days = float(match.group(1))
-            self.avg_label.config(text=f"📊 {avg_str.split(': ', 1)[-1]}")
-        except ValueError:
+        # Average Interval / Next Watering
+        stats = plant_backend.plant_watering_stats(info)
+        if stats["average_interval"] is not None:
+            self.avg_label.config(text=f"📊 Average days between watering: {stats['average_interval']:.1f}")
+        else:
             self.avg_label.config(text="📊 Not enough watering data yet.")
 
-        # Next Watering
-        if last_watered != "No record" and avg_days is not None:
-            try:
-                last_date = datetime.strptime(last_watered, "%Y-%m-%d")
-                next_date = last_date + timedelta(days=round(avg_days))
-                formatted = next_date.strftime("%Y-%m-%d")
-
-                if next_date <= datetime.now():
-                    self.next_water_label.config(
-                        text=f"🔴 Next Watering: {formatted}"
-                    )
-                else:
-                    self.next_water_label.config(text=f"🟢 Next Watering: {formatted}")
-            except Exception:
-                self.next_water_label.config(text="⚪ Next Watering: —")
+        next_due = stats["next_due"]
+        if next_due is not None:
+            formatted = next_due.strftime("%Y-%m-%d")
+            if stats["overdue_days"] >= 0:
+                self.next_water_label.config(text=f"🔴 Next Watering: {formatted}")
+            else:
+                self.next_water_label.config(text=f"🟢 Next Watering: {formatted}")
         else:
             self.next_water_label.config(text=" Next Watering: —")
 
@@ -317,9 +352,10 @@ class WaterPlantPage(ttk.Frame):
             return
 
         try:
-            self.controller.plants = plant_backend.water_plant_gui(self.controller.plants, plant_name)
+            self.controller.plants = self.controller.store.water_plant_gui(
+                self.controller.plants, plant_name, path=self.controller.data_file
+            )
             messagebox.showinfo("Success", f"{plant_name} watered today!")
-            self.update_display_info()
         except ValueError as e:
             messagebox.showerror("Error", str(e))
 
@@ -418,12 +454,64 @@ class ShowPlantsPage(ttk.Frame):
 
         ttk.Button(self, text="Refresh List", command=self.refresh_plants).pack(pady=5)
 
+        # Each displayed plant's text is tagged so it can be patched in place
+        self.row_tags = {}  # plant name -> text tag
+        self.displayed = []  # plant names in display order
+        self.alphabetical = True
+        self.tag_ids = itertools.count()
+
     def refresh_plants(self):
         """Reload and display all plants (alphabetically by default)."""
-        self.controller.plants = plant_backend.load_plants()
-        all_plants_str = plant_backend.show_all_plants_gui(self.controller.plants)
+        self.controller.reload_plants()
+
+    def render_all(self):
+        """Display every plant alphabetically."""
+        self._render(sorted(self.controller.plants.items(), key=lambda p: p[0].lower()), "No plants added yet.\n")
+        self.alphabetical = True
+
+    def _render(self, plant_items, empty_text):
+        for tag in self.row_tags.values():
+            self.text_box.tag_delete(tag)
+        self.row_tags = {}
+        self.displayed = []
         self.text_box.delete("1.0", tk.END)
-        self.text_box.insert(tk.END, all_plants_str)
+
+        if not plant_items:
+            self.text_box.insert(tk.END, empty_text)
+            return
+        for name, info in plant_items:
+            self._insert_row(tk.END, name, info)
+            self.displayed.append(name)
+
+    def _insert_row(self, index, name, info):
+        tag = self.row_tags[name] = f"plant{next(self.tag_ids)}"
+        self.text_box.insert(index, plant_backend.show_plant_gui(name, info), (tag,))
+
+    def on_plant_event(self, event, plant_name, info):
+        """Patch only the text of the plant that changed."""
+        tag = self.row_tags.get(plant_name)
+        if tag is not None:
+            start, end = map(str, self.text_box.tag_ranges(tag))
+            self.text_box.delete(start, end)
+            self.text_box.tag_delete(tag)
+            del self.row_tags[plant_name]
+            if event == "removed":
+                self.displayed.remove(plant_name)
+                if not self.displayed:
+                    self.text_box.insert(tk.END, "No plants added yet.\n")
+            else:
+                self._insert_row(start, plant_name, info)
+        elif event == "added" and self.alphabetical:
+            if not self.displayed:
+                self.text_box.delete("1.0", tk.END)
+            keys = [name.lower() for name in self.displayed]
+            position = bisect_left(keys, plant_name.lower())
+            if position < len(self.displayed):
+                index = str(self.text_box.tag_ranges(self.row_tags[self.displayed[position]])[0])
+            else:
+                index = tk.END
+            self._insert_row(index, plant_name, info)
+            self.displayed.insert(position, plant_name)
 
     def sort_and_display(self):
         """Sort and display plants based on selected criteria."""
@@ -445,38 +533,21 @@ class ShowPlantsPage(ttk.Frame):
 
         # ====== Filter overdue plants if "Needs watering" is selected ======
         if key == "needs_watering":
-            today = datetime.now()
-            filtered_list = []
-            for name, info in sorted_list:
-                last = info.get("last_watered")
-                history = info.get("watering_history", [])
-                if last and len(history) >= 2:
-                    dates = [datetime.strptime(d, "%Y-%m-%d") for d in history]
-                    diffs = [(dates[i] - dates[i - 1]).days for i in range(1, len(dates))]
-                    avg = sum(diffs) / len(diffs)
-                    next_date = datetime.strptime(last, "%Y-%m-%d") + timedelta(days=avg)
-                    if next_date <= today:
-                        filtered_list.append((name, info))
-            sorted_list = filtered_list
+            stats = plant_backend.watering_stats_all(self.controller.plants)
+            sorted_list = [
+                (name, info) for name, info in sorted_list
+                if stats[name]["overdue_days"] is not None and stats[name]["overdue_days"] >= 0
+            ]
         # -------------------------------------------------------------
 
-        self.text_box.delete(1.0, tk.END)
-        if not sorted_list:
-            self.text_box.insert(tk.END, "No plants found for this filter.\n")
-            return
-
-        for name, info in sorted_list:
-            self.text_box.insert(
-                tk.END,
-                f"🍃 {name} ({info['scientific_name']})\n"
-                f"   Date acquired: {info['date_acquired']}\n"
-                f"   Last watered: {info['last_watered']}\n"
-                f"   Light intensity: {info['light_intensity']}\n"
-                f"   Light type: {info['light_type']}\n"
-                f"   Minimum humidity: {info['min_humidity']}\n"
-                f"   Notes: {info['notes']}\n\n"
-            )
+        self._render(sorted_list, "No plants found for this filter.\n")
+        self.alphabetical = key == "common_name" and not reverse
 
 if __name__ == "__main__":
-    app = PlantApp()
+    parser = argparse.ArgumentParser(description="Plant Tracker window")
+    parser.add_argument("--file", help=f"plants collection file (default: {plant_backend.DATA_FILE})")
+    parser.add_argument("--server", help="use a running plant_server (e.g. http://127.0.0.1:8765) instead of the file")
+    args = parser.parse_args()
+
+    app = PlantApp(server_url=args.server, data_file=args.file)
     app.mainloop()
@@ -0,0 +1,108 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+from datetime import date, timedelta
+import plant_backend
+
+def _collection(count, seed=0):
+    """A sorted collection with varied field types, including non-ASCII names."""
+    rng = random.Random(seed)
+    plants = {}
+    for i in range(count):
+        day = date(2022, 1, 1) + timedelta(days=rng.randint(0, 300))
+        history = []
+        for _ in range(rng.randint(0, 40)):
+            day += timedelta(days=rng.randint(1, 20))
+            history.append(day.isoformat())
+        suffix = rng.choice(["", " ÉTOILE", " 🌱", ' A "QUOTED" ONE'])
+        plants[f"PLANT {i:04d}{suffix}"] = {
+            "scientific_name": rng.choice([None, "Ficus lyrata", "Monstera\tdeliciosa"]),
+            "date_acquired": rng.choice([None, "2021-05-04"]),
+            "last_watered": history[-1] if history else None,
+            "watering_history": history,
+            "light_intensity": rng.choice(["Low", "Medium", "High"]),
+            "light_type": rng.choice(["Direct", "Indirect"]),
+            "min_humidity": rng.choice([None, 0.4, 0.65, 1]),
+            "notes": rng.choice([None, "", "line one\nline two"])
+        }
+    return dict(sorted(plants.items(), key=lambda p: p[0].lower()))
+
+class PlantSerializerTest(unittest.TestCase):
+
+    def test_matches_json_dumps(self):
+        plants = _collection(300)
+        self.assertEqual(plant_backend.PlantSerializer(4).encode(plants), json.dumps(plants, indent=4))
+        self.assertEqual(
+            plant_backend.PlantSerializer(None).encode(plants),
+            json.dumps(plants, separators=(",", ":"))
+        )
+        self.assertEqual(plant_backend.PlantSerializer(4).encode({}), json.dumps({}, indent=4))
+
+    def test_only_dirty_plants_are_reencoded(self):
+        plants = _collection(20)
+        serializer = plant_backend.PlantSerializer(4)
+        serializer.encode(plants)
+
+        name = next(iter(plants))
+        plants[name]["notes"] = "changed in place"
+        # Unmarked in-place edits keep the cached fragment...
+        self.assertNotEqual(serializer.encode(plants), json.dumps(plants, indent=4))
+        # ...marking the plant dirty re-encodes it
+        serializer.mark_dirty(name)
+        self.assertEqual(serializer.encode(plants), json.dumps(plants, indent=4))
+
+        # Replaced records and removed plants need no marking
+        plants[name] = dict(plants[name], notes="replaced")
+        del plants[list(plants)[-1]]
+        self.assertEqual(serializer.encode(plants), json.dumps(plants, indent=4))
+        self.assertEqual(set(serializer.fragments), set(plants))
+
+    def test_saved_file_after_backend_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "plants.json")
+            plants = _collection(50)
+            plant_backend.save_plants(plants, path)
+
+            name = next(iter(plants))
+            plant_backend.water_plant_gui(plants, name, path=path)
+            plants = plant_backend.add_plant_gui(plants, {"common_name": "new plant"}, path=path)
+            plant_backend.remove_plant_gui(plants, list(plants)[-1], path=path)
+
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), json.dumps(plants, indent=4).encode("utf-8"))
+
+class StoragePresetTest(unittest.TestCase):
+
+    def test_round_trip_every_preset(self):
+        plants = _collection(30)
+        with tempfile.TemporaryDirectory() as tmp:
+            for preset in plant_backend.STORAGE_PRESETS:
+                path = os.path.join(tmp, f"{preset}.json")
+                plant_backend.write_plants(plants, path, preset=preset)
+                with open(path, "rb") as f:
+                    self.assertEqual(plant_backend._detect_preset(f.read()), preset)
+                self.assertEqual(plant_backend.read_plants(path), plants)
+
+    def test_detects_presets_from_magic_bytes(self):
+        detect = plant_backend._detect_preset
+        self.assertEqual(detect(b"\x1f\x8b\x08\x00"), "balanced")
+        self.assertEqual(detect(b"\xfd7zXZ\x00\x00"), "small")
+        self.assertEqual(detect(b"\x78\x9c\x00"), "fast")
+        self.assertEqual(detect(b"\x78\x01\x00"), "fast")
+        self.assertEqual(detect(b"{\n    \"FERN\": {}\n}"), "readable")
+        self.assertEqual(detect(b"{}"), "readable")
+        self.assertEqual(detect(b'{"FERN":{}}'), "compact")
+
+    def test_corrupt_compressed_files_raise_value_error(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for data in (b"\x78\x9cgarbage", b"\x1f\x8bgarbage", b"\xfd7zXZ\x00garbage"):
+                path = os.path.join(tmp, "bad.json")
+                with open(path, "wb") as f:
+                    f.write(data)
+                with self.assertRaises(ValueError):
+                    plant_backend.load_plants(path)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import date, timedelta
+import plant_backend
+from .test_plant_backend import _collection
+
+class CompactionTest(unittest.TestCase):
+
+    def test_stats_unchanged_by_compaction(self):
+        plants = _collection(200, seed=1)
+        today = date(2024, 6, 1)
+        before = plant_backend.watering_stats_all(plants, today)
+
+        # Fold into monthly buckets, then roll older months into years
+        plant_backend.compact_history(plants, keep_days=300, monthly_days=400, today=today, save=False)
+        self.assertTrue(any(info.get("watering_archive") for info in plants.values()))
+        self.assertEqual(plant_backend.watering_stats_all(plants, today), before)
+
+        plant_backend.compact_history(plants, keep_days=30, monthly_days=60, today=today, save=False)
+        self.assertEqual(plant_backend.watering_stats_all(plants, today), before)
+
+    def test_buckets_keep_interval_totals(self):
+        history = ["2023-01-01", "2023-01-05", "2023-02-01", "2023-02-11", "2024-01-01"]
+        plants = {"FERN": {"watering_history": list(history), "last_watered": history[-1]}}
+        plant_backend.compact_history(plants, keep_days=30, today=date(2024, 1, 15), save=False)
+
+        archive = plants["FERN"]["watering_archive"]
+        self.assertEqual(plants["FERN"]["watering_history"], ["2024-01-01"])
+        self.assertEqual(sum(bucket["count"] for bucket in archive), 4)
+        self.assertEqual(sum(bucket["interval_sum"] for bucket in archive), 41)
+        self.assertEqual(min(b["min_interval"] for b in archive if b["min_interval"] is not None), 4)
+        self.assertEqual(max(b["max_interval"] for b in archive if b["max_interval"] is not None), 27)
+
+    def test_rerun_without_new_history_touches_nothing(self):
+        plants = _collection(50, seed=2)
+        today = date(2024, 6, 1)
+        plant_backend.compact_history(plants, keep_days=300, today=today, save=False)
+        before = json.dumps(plants)
+
+        events = []
+        listener = lambda event, name, info: events.append(name)
+        plant_backend.subscribe(listener)
+        self.addCleanup(plant_backend.unsubscribe, listener)
+        plant_backend.compact_history(plants, keep_days=300, today=today, save=False)
+        self.assertEqual(events, [])
+        self.assertEqual(json.dumps(plants), before)
+
+        # A month later only plants with newly old waterings change
+        later = today + timedelta(days=31)
+        newly_old = {
+            name for name, info in plants.items()
+            if any(d < (later - timedelta(days=300)).isoformat() for d in info["watering_history"])
+        }
+        plant_backend.compact_history(plants, keep_days=300, today=later, save=False)
+        self.assertEqual(set(events), newly_old)
+
+    def test_raw_archive_lives_next_to_its_collection(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            today = date(2024, 6, 1)
+            for name in ("site", "home"):
+                path = os.path.join(tmp, f"{name}.json")
+                plants = _collection(20, seed=3)
+                full = {plant: list(info["watering_history"]) for plant, info in plants.items()}
+                plant_backend.compact_history(plants, keep_days=200, today=today, path=path, keep_raw=True)
+
+                self.assertEqual(plant_backend.archive_path(path), os.path.join(tmp, f"{name}_archive.json"))
+                for plant in plants:
+                    self.assertEqual(plant_backend.load_full_history(plants, plant, path=path), full[plant])
+            self.assertEqual(sorted(os.listdir(tmp)), ["home.json", "home_archive.json", "site.json", "site_archive.json"])
+        self.assertEqual(plant_backend.archive_path(), "plants_archive.json")
+
+if __name__ == "__main__":
+    unittest.main()
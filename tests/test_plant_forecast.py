@@ -0,0 +1,93 @@
+import unittest
+from datetime import date, timedelta
+import plant_backend
+import plant_forecast
+
+TODAY = date(2026, 3, 10)
+
+def _plant(*days_ago):
+    history = [(TODAY - timedelta(days=days)).isoformat() for days in days_ago]
+    return {"watering_history": history, "last_watered": history[-1] if history else None}
+
+def _bucket(period, first, last, count, interval_sum):
+    return {"period": period, "first": first, "last": last, "count": count,
+            "interval_sum": interval_sum, "min_interval": None, "max_interval": None}
+
+class EwmaIntervalTest(unittest.TestCase):
+
+    def test_recent_intervals_weigh_more(self):
+        info = _plant(22, 12, 2, 0)  # intervals 10, 10, 2
+        self.assertEqual(plant_forecast.ewma_interval(info, 0.5), 6)
+        self.assertEqual(plant_forecast.ewma_interval(info, 1), 2)
+        self.assertIsNone(plant_forecast.ewma_interval(_plant(3), 0.5))
+
+    def test_archive_mean_seeds_the_average(self):
+        # 5 compacted waterings 40 days apart in total (mean 10), then 4 days to the raw date
+        info = {
+            "watering_archive": [_bucket("2025", "2025-01-01", "2025-01-31", 3, 30),
+                                 _bucket("2025-02", "2025-02-05", "2025-02-10", 2, 10)],
+            "watering_history": ["2025-02-14"],
+            "last_watered": "2025-02-14"
+        }
+        self.assertEqual(plant_forecast.ewma_interval(info, 0.5), 7)
+
+    def test_single_archived_date_does_not_seed(self):
+        info = {
+            "watering_archive": [_bucket("2025-02", "2025-02-10", "2025-02-10", 1, 0)],
+            "watering_history": ["2025-02-14", "2025-02-20"],
+            "last_watered": "2025-02-20"
+        }
+        # Intervals 4 then 6, starting from the archive's last date
+        self.assertEqual(plant_forecast.ewma_interval(info, 0.5), 5)
+
+class WateringForecastTest(unittest.TestCase):
+
+    def test_mean_projection(self):
+        plants = {"FERN": _plant(17, 10, 3), "OVERDUE": _plant(30, 20), "NEW": _plant(1)}
+        forecast = plant_forecast.WateringForecast(plants, days=14, today=TODAY)
+        self.assertEqual(forecast.schedule["FERN"], [(TODAY + timedelta(days=d)).toordinal() for d in (4, 11)])
+        # Overdue plants are due today, then every interval after that
+        self.assertEqual(forecast.schedule["OVERDUE"], [(TODAY + timedelta(days=d)).toordinal() for d in (0, 10)])
+        self.assertNotIn("NEW", forecast.schedule)
+        self.assertEqual(forecast.due_on(TODAY), ["OVERDUE"])
+        calendar = forecast.calendar()
+        self.assertEqual(len(calendar), 14)
+        self.assertEqual(sum(day["count"] for day in calendar), 4)
+
+    def test_ewma_projection(self):
+        plants = {"FERN": _plant(22, 12, 2, 0)}  # mean 7.33, EWMA(0.5) 6
+        mean = plant_forecast.WateringForecast(plants, days=14, today=TODAY)
+        ewma = plant_forecast.WateringForecast(plants, days=14, alpha=0.5, today=TODAY)
+        self.assertEqual(mean.due_on(TODAY + timedelta(days=7)), ["FERN"])
+        self.assertEqual(ewma.due_on(TODAY + timedelta(days=6)), ["FERN"])
+        self.assertEqual(ewma.due_on(TODAY + timedelta(days=12)), ["FERN"])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            plant_forecast.WateringForecast({}, days=0)
+        with self.assertRaises(ValueError):
+            plant_forecast.WateringForecast({}, alpha=1.5)
+
+    def test_follows_backend_events(self):
+        plants = {"FERN": _plant(30, 20)}
+        forecast = plant_forecast.WateringForecast(plants, days=14)
+        plant_backend.subscribe(forecast.on_plant_event)
+        self.addCleanup(plant_backend.unsubscribe, forecast.on_plant_event)
+        today = date.today()
+        self.assertEqual(forecast.due_on(today), ["FERN"])
+
+        plant_backend.water_plant_gui(plants, "fern", save=False)
+        self.assertEqual(forecast.due_on(today), [])
+
+        # Added plants arrive in a new dictionary; the event carries the record
+        old = [(today - timedelta(days=days)).isoformat() for days in (30, 20)]
+        plants = plant_backend.import_plants(plants, {"PALM": {"watering_history": old, "last_watered": old[-1]}},
+                                             save=False)
+        self.assertEqual(forecast.due_on(today), ["PALM"])
+
+        plant_backend.remove_plant_gui(plants, "fern", save=False)
+        self.assertEqual(set(forecast.schedule), {"PALM"})
+        self.assertEqual(sum(day["count"] for day in forecast.calendar()), len(forecast.schedule["PALM"]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+from datetime import date
+import plant_backend
+
+def _plants():
+    return {
+        "FERN": {"watering_history": ["2026-03-01", "2026-03-08", "2026-03-15"], "last_watered": "2026-03-15"},
+        "PALM": {"watering_history": ["2026-03-08", "2026-03-09"], "last_watered": "2026-03-09"},
+        "CACTUS": {"watering_history": [], "last_watered": None}
+    }
+
+class RangeQueryTest(unittest.TestCase):
+
+    def test_waterings_between_includes_both_ends(self):
+        plants = _plants()
+        self.assertEqual(
+            plant_backend.waterings_between(plants, "fern", "2026-03-01", "2026-03-15"),
+            ["2026-03-01", "2026-03-08", "2026-03-15"]
+        )
+        self.assertEqual(plant_backend.waterings_between(plants, "FERN", date(2026, 3, 2), date(2026, 3, 14)),
+                         ["2026-03-08"])
+        self.assertEqual(plant_backend.waterings_between(plants, "FERN", "2026-03-08", "2026-03-08"), ["2026-03-08"])
+
+    def test_empty_ranges(self):
+        plants = _plants()
+        self.assertEqual(plant_backend.waterings_between(plants, "FERN", "2026-03-16", "2026-04-01"), [])
+        self.assertEqual(plant_backend.waterings_between(plants, "FERN", "2026-03-15", "2026-03-01"), [])
+        self.assertEqual(plant_backend.waterings_between(plants, "CACTUS", "2026-01-01", "2026-12-31"), [])
+        self.assertEqual(plant_backend.count_waterings_between(plants, "2026-03-10", "2026-03-14"), {})
+        with self.assertRaises(ValueError):
+            plant_backend.waterings_between(plants, "NOPE", "2026-03-01", "2026-03-02")
+
+    def test_count_waterings_between(self):
+        self.assertEqual(
+            plant_backend.count_waterings_between(_plants(), "2026-03-08", "2026-03-15"),
+            {"FERN": 2, "PALM": 2}
+        )
+
+class WateringIndexTest(unittest.TestCase):
+
+    def test_day_and_range_lookups(self):
+        index = plant_backend.WateringIndex(_plants())
+        self.assertEqual(index.plants_on("2026-03-08"), ["FERN", "PALM"])
+        self.assertEqual(index.plants_on("2026-03-10"), [])
+        self.assertEqual(
+            index.between("2026-03-08", "2026-03-09"),
+            [(date(2026, 3, 8), ["FERN", "PALM"]), (date(2026, 3, 9), ["PALM"])]
+        )
+        self.assertEqual(index.between("2026-03-10", "2026-03-14"), [])
+        self.assertEqual(index.between("2026-03-15", "2026-03-01"), [])
+
+    def test_week_edges(self):
+        index = plant_backend.WateringIndex(_plants())
+        # 2026-03-08 is a Sunday and 2026-03-09 a Monday, so they fall in different weeks
+        self.assertEqual(index.week_activity("2026-03-02"), {date(2026, 3, 8): ["FERN", "PALM"]})
+        self.assertEqual(index.week_activity("2026-03-08"), {date(2026, 3, 8): ["FERN", "PALM"]})
+        self.assertEqual(
+            index.week_activity("2026-03-09"),
+            {date(2026, 3, 9): ["PALM"], date(2026, 3, 15): ["FERN"]}
+        )
+
+    def test_follows_backend_events(self):
+        plants = _plants()
+        index = plant_backend.WateringIndex(plants)
+        plant_backend.subscribe(index.on_plant_event)
+        self.addCleanup(plant_backend.unsubscribe, index.on_plant_event)
+
+        plant_backend.water_plant_gui(plants, "cactus", save=False)
+        self.assertEqual(index.plants_on(date.today()), ["CACTUS"])
+
+        plant_backend.remove_plant_gui(plants, "palm", save=False)
+        self.assertEqual(index.plants_on("2026-03-09"), [])
+
+        # Compacted dates leave the index along with the raw history
+        plant_backend.compact_history(plants, keep_days=30, today=date(2026, 4, 10), save=False)
+        self.assertEqual(index.plants_on("2026-03-08"), [])
+        self.assertEqual(index.plants_on("2026-03-15"), ["FERN"])
+
+    def test_activity_report(self):
+        report = plant_backend.activity_report(_plants(), "2026-03-09")
+        self.assertEqual((report["start"], report["end"]), ("2026-03-09", "2026-03-15"))
+        self.assertEqual(report["days"], [
+            {"date": "2026-03-09", "plants": ["PALM"]},
+            {"date": "2026-03-15", "plants": ["FERN"]}
+        ])
+        self.assertEqual(report["counts"], {"FERN": 1, "PALM": 1})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date, datetime, timedelta
+import plant_backend
+import plant_scheduler
+
+def _plant(*days_ago):
+    history = [(date.today() - timedelta(days=days)).isoformat() for days in days_ago]
+    return {"watering_history": history, "last_watered": history[-1] if history else None}
+
+class RecordingSink:
+    def __init__(self):
+        self.calls = []
+        self.event = threading.Event()
+
+    def __call__(self, common_name, next_due):
+        self.calls.append((common_name, next_due))
+        self.event.set()
+
+class ReminderSchedulerTest(unittest.TestCase):
+
+    def _start(self, plants, sink, **kwargs):
+        scheduler = plant_scheduler.ReminderScheduler(plants, sink, remind_at=datetime.now().time(), **kwargs)
+        scheduler.start()
+        self.addCleanup(scheduler.stop)
+        return scheduler
+
+    def test_overdue_plants_fire_once_together(self):
+        plants = {f"PLANT {i}": _plant(30, 20) for i in range(50)}
+        plants["FRESH"] = _plant(3, 1)  # due tomorrow
+        plants["NEW"] = _plant()  # no interval yet
+        sink = RecordingSink()
+        self._start(plants, sink)
+
+        self.assertTrue(sink.event.wait(2))
+        time.sleep(0.2)
+        self.assertEqual(sorted(name for name, _ in sink.calls), sorted(f"PLANT {i}" for i in range(50)))
+
+    def test_watering_cancels_pending_reminder(self):
+        sink = RecordingSink()
+        scheduler = plant_scheduler.ReminderScheduler(
+            {"FERN": _plant(30, 20)}, sink, remind_at=(datetime.now() + timedelta(seconds=0.5)).time()
+        )
+        scheduler.reschedule("FERN", _plant(10, 0))
+        scheduler.start()
+        self.addCleanup(scheduler.stop)
+        time.sleep(0.8)
+        self.assertEqual(sink.calls, [])
+
+    def test_empty_collection_picks_up_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "plants.json")
+            plant_backend.save_plants({}, path)
+            sink = RecordingSink()
+            self._start({}, sink, path=path, poll_seconds=0.1)
+            time.sleep(0.2)
+
+            plant_backend.save_plants({"FERN": _plant(30, 20)}, path)
+            self.assertTrue(sink.event.wait(2))
+            self.assertEqual([name for name, _ in sink.calls], ["FERN"])
+
+class FakeRoot:
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, delay, callback):
+        self.callbacks.append(callback)
+
+class TkPopupSinkTest(unittest.TestCase):
+
+    def test_reminders_together_share_one_window_update(self):
+        root = FakeRoot()
+        sink = plant_scheduler.TkPopupSink(root)
+        for name in ("FERN", "PALM", "CACTUS"):
+            sink(name, date(2026, 1, 1))
+        self.assertEqual(len(root.callbacks), 1)
+        self.assertEqual(len(sink._pending), 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from datetime import date, timedelta
+import plant_backend
+import plant_server
+
+def _plant(history):
+    return {
+        "scientific_name": None,
+        "date_acquired": "2024-01-01",
+        "last_watered": history[-1] if history else None,
+        "watering_history": history,
+        "light_intensity": "Medium",
+        "light_type": "Indirect",
+        "min_humidity": 0.5,
+        "notes": None
+    }
+
+class PlantServerTest(unittest.TestCase):
+    """Drive a local PlantServer on a free port through PlantClient."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "plants.json")
+        old = [(date.today() - timedelta(days=days)).isoformat() for days in (30, 20)]
+        plant_backend.save_plants({
+            "FERN": _plant(old),
+            "PALM": _plant([])
+        }, self.path)
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.server = plant_server.PlantServer(path=self.path, port=0, flush_delay=60)
+        self._run(self.server.start())
+        self.client = plant_server.PlantClient(f"http://127.0.0.1:{self.server.port}")
+
+    def tearDown(self):
+        self._run(self.server.stop())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+        self.tmp.cleanup()
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout=5)
+
+    def test_add_water_remove_and_flush(self):
+        plants = self.client.load_plants()
+        plants = self.client.add_plant_gui(plants, {"common_name": "cactus", "light_intensity": "High"})
+        self.assertIn("CACTUS", plants)
+
+        self.client.water_plant_gui(plants, "cactus")
+        self.assertEqual(plants["CACTUS"]["watering_history"], [date.today().isoformat()])
+
+        self.client.remove_plant_gui(plants, "palm")
+        self.assertNotIn("PALM", plants)
+        self.assertEqual(set(self.client.load_plants()), {"CACTUS", "FERN"})
+
+        self.client.save_plants(plants)
+        self.assertEqual(set(plant_backend.read_plants(self.path)), {"CACTUS", "FERN"})
+        self.assertIn("PALM", plant_backend.load_tombstones(self.path))
+
+    def test_partial_update_keeps_other_fields(self):
+        plants = self.client.load_plants()
+        plants = self.client.add_plant_gui(plants, {"common_name": "fern", "notes": "repotted"})
+        self.assertEqual(plants["FERN"]["notes"], "repotted")
+        self.assertEqual(plants["FERN"]["light_intensity"], "Medium")
+        self.assertEqual(plants["FERN"]["date_acquired"], "2024-01-01")
+        self.assertEqual(len(plants["FERN"]["watering_history"]), 2)
+
+    def test_sort_stats_and_due(self):
+        sorted_list = self.client.sort_plants(reverse=True, limit=1)
+        self.assertEqual([p["common_name"] for p in sorted_list], ["PALM"])
+
+        stats = self.client.watering_stats("fern")
+        self.assertEqual(stats["average_interval"], 10)
+        self.assertIsNone(self.client.watering_stats()["PALM"]["average_interval"])
+
+        # Last watered 20 days ago every 10 days: 10 days overdue
+        due = self.client.due_plants()
+        self.assertEqual([(d["common_name"], d["overdue_days"]) for d in due], [("FERN", 10)])
+
+    def test_activity_follows_changes(self):
+        today = date.today().isoformat()
+        self.assertEqual(self.client.watering_activity(today, today)["days"], [])
+        self.client.water_plant_gui({}, "palm")
+        activity = self.client.watering_activity(today, today)
+        self.assertEqual(activity["days"], [{"date": today, "plants": ["PALM"]}])
+        self.assertEqual(activity["counts"], {"PALM": 1})
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            self.client.water_plant_gui({}, "nope")
+        with self.assertRaises(ValueError):
+            self.client._request("POST", "/plants", ["not", "an", "object"])
+        with self.assertRaises(ValueError):
+            self.client._request("GET", "/unknown")
+
+    def test_malformed_request_line(self):
+        with socket.create_connection(("127.0.0.1", self.server.port), timeout=5) as sock:
+            sock.sendall(b"GARBAGE\r\n\r\n")
+            response = sock.makefile("rb").read()
+        self.assertTrue(response.startswith(b"HTTP/1.1 400"))
+        self.assertIn("error", json.loads(response.split(b"\r\n\r\n", 1)[1]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+import plant_backend
+import plant_sync
+
+def _plant(history, notes="orig"):
+    return {
+        "scientific_name": "Nephrolepis exaltata",
+        "date_acquired": "2024-01-01",
+        "last_watered": history[-1] if history else None,
+        "watering_history": list(history),
+        "light_intensity": "Medium",
+        "light_type": "Indirect",
+        "min_humidity": 0.5,
+        "notes": notes,
+        "modified": "2025-01-01T00:00:00.000000Z"
+    }
+
+class SyncTest(unittest.TestCase):
+    """Two copies of one collection in temporary files."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path_a = os.path.join(self.tmp.name, "a.json")
+        self.path_b = os.path.join(self.tmp.name, "b.json")
+        plants = {"FERN": _plant(["2026-01-01", "2026-01-11"]), "PALM": _plant([])}
+        plant_backend.save_plants(plants, self.path_a)
+        plant_backend.save_plants(plants, self.path_b)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _edit(self, path, name, **fields):
+        plants = plant_backend.load_plants(path)
+        plant_data = dict(plants[name], common_name=name, **fields)
+        plant_backend.add_plant_gui(plants, plant_data, path=path)
+
+    def test_identical_copies_have_empty_delta(self):
+        a, b = plant_backend.load_plants(self.path_a), plant_backend.load_plants(self.path_b)
+        self.assertEqual(plant_sync.delta_size(plant_sync.compute_delta(a, b)), 0)
+
+    def test_field_edit_survives_watering_on_other_copy(self):
+        self._edit(self.path_b, "FERN", notes="changed on b")
+        plants_a = plant_backend.load_plants(self.path_a)
+        plant_backend.water_plant_gui(plants_a, "FERN", path=self.path_a)
+
+        plant_sync.sync_collections(self.path_a, self.path_b)
+        today = date.today().isoformat()
+        for path in (self.path_a, self.path_b):
+            fern = plant_backend.load_plants(path)["FERN"]
+            self.assertEqual(fern["notes"], "changed on b")
+            self.assertEqual(fern["watering_history"], ["2026-01-01", "2026-01-11", today])
+            self.assertEqual(fern["last_watered"], today)
+
+    def test_one_way_apply_leaves_target_dates_to_send_back(self):
+        plants_b = plant_backend.load_plants(self.path_b)
+        plants_b["FERN"]["watering_history"].append("2026-02-01")
+        plants_a = plant_backend.load_plants(self.path_a)
+        plant_backend.water_plant_gui(plants_a, "FERN", save=False)
+
+        plants_b = plant_sync.apply_delta(plants_b, plant_sync.compute_delta(plants_a, plants_b), save=False)
+        back = plant_sync.compute_delta(plants_b, plants_a)
+        self.assertEqual(back["history"], {"FERN": ["2026-02-01"]})
+
+        plant_sync.apply_delta(plants_a, back, save=False)
+        self.assertEqual(plants_a["FERN"]["watering_history"], plants_b["FERN"]["watering_history"])
+        self.assertEqual(plant_sync.delta_size(plant_sync.compute_delta(plants_a, plants_b)), 0)
+
+    def test_newer_field_edit_wins(self):
+        self._edit(self.path_a, "FERN", notes="first")
+        self._edit(self.path_b, "FERN", notes="second")
+        plant_sync.sync_collections(self.path_a, self.path_b)
+        for path in (self.path_a, self.path_b):
+            self.assertEqual(plant_backend.load_plants(path)["FERN"]["notes"], "second")
+
+    def test_added_and_removed_plants(self):
+        plants_a = plant_backend.load_plants(self.path_a)
+        plants_a = plant_backend.add_plant_gui(plants_a, {"common_name": "cactus"}, path=self.path_a)
+        plant_backend.remove_plant_gui(plants_a, "PALM", path=self.path_a)
+        self.assertIn("PALM", plant_backend.load_tombstones(self.path_a))
+
+        to_a, to_b = plant_sync.sync_collections(self.path_a, self.path_b)
+        self.assertEqual(plant_sync.delta_size(to_a), 0)
+        self.assertEqual(set(to_b["added"]), {"CACTUS"})
+        self.assertEqual(set(to_b["removed"]), {"PALM"})
+        self.assertEqual(set(plant_backend.load_plants(self.path_b)), {"CACTUS", "FERN"})
+        self.assertIn("PALM", plant_backend.load_tombstones(self.path_b))
+
+        # The removal does not come back on the next sync
+        to_a, to_b = plant_sync.sync_collections(self.path_a, self.path_b)
+        self.assertEqual((plant_sync.delta_size(to_a), plant_sync.delta_size(to_b)), (0, 0))
+
+    def test_plant_edited_after_removal_is_kept(self):
+        plants_a = plant_backend.load_plants(self.path_a)
+        plant_backend.remove_plant_gui(plants_a, "PALM", path=self.path_a)
+        self._edit(self.path_b, "PALM", notes="still here")
+
+        plant_sync.sync_collections(self.path_a, self.path_b)
+        for path in (self.path_a, self.path_b):
+            self.assertEqual(plant_backend.load_plants(path)["PALM"]["notes"], "still here")
+
+    def test_compacted_archive_is_not_counted_twice(self):
+        history = [f"2025-{month:02d}-{day:02d}" for month in range(1, 13) for day in (1, 11, 21)]
+        for path in (self.path_a, self.path_b):
+            plants = plant_backend.load_plants(path)
+            plants["FERN"] = _plant(history)
+            plant_backend.save_plants(plants, path)
+
+        today = date(2026, 1, 5)
+        before = plant_backend.watering_stats(plant_backend.load_plants(self.path_b), "FERN", today)
+        plants_a = plant_backend.load_plants(self.path_a)
+        plant_backend.compact_history(plants_a, keep_days=90, today=today, path=self.path_a)
+
+        to_a, to_b = plant_sync.sync_collections(self.path_a, self.path_b)
+        self.assertEqual(set(to_b["archive"]), {"FERN"})
+        for path in (self.path_a, self.path_b):
+            plants = plant_backend.load_plants(path)
+            self.assertEqual(plant_backend.watering_stats(plants, "FERN", today), before)
+            self.assertEqual(plants["FERN"]["watering_history"], plants_a["FERN"]["watering_history"])
+
+if __name__ == "__main__":
+    unittest.main()
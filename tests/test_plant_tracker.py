@@ -0,0 +1,74 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+import plant_backend
+import plant_tracker
+
+class BatchModeTest(unittest.TestCase):
+    """Run plant_tracker batch commands against a temporary collection file."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "plants.json")
+        plants = plant_backend.add_plant_gui({}, {
+            "common_name": "fern",
+            "scientific_name": "Nephrolepis exaltata",
+            "date_acquired": "2024-01-01",
+            "light_intensity": "Medium",
+            "light_type": "Indirect",
+            "min_humidity": 0.5,
+            "notes": "orig"
+        }, path=self.path)
+        plant_backend.water_plant_gui(plants, "fern", path=self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, *argv):
+        """Return (exit code, parsed JSON output)."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            code = plant_tracker.run_batch(["--file", self.path] + list(argv))
+        return code, json.loads(output.getvalue())
+
+    def _script(self, text):
+        script = os.path.join(self.tmp.name, "script.txt")
+        with open(script, "w") as f:
+            f.write(text)
+        return self._run("run", script)
+
+    def test_add_updates_only_given_options(self):
+        code, _ = self._run("add", "fern", "--notes", "changed")
+        self.assertEqual(code, 0)
+        fern = plant_backend.load_plants(self.path)["FERN"]
+        self.assertEqual(fern["notes"], "changed")
+        self.assertEqual(fern["scientific_name"], "Nephrolepis exaltata")
+        self.assertEqual(fern["light_intensity"], "Medium")
+        self.assertEqual(fern["min_humidity"], 0.5)
+        self.assertEqual(len(fern["watering_history"]), 1)
+
+    def test_water_checks_every_name_first(self):
+        code, output = self._run("water", "fern", "nope")
+        self.assertEqual((code, output["ok"]), (1, False))
+        self.assertEqual(len(plant_backend.load_plants(self.path)["FERN"]["watering_history"]), 1)
+
+    def test_script_line_with_unbalanced_quote_fails_alone(self):
+        code, output = self._script('# comment\nadd "FERN\nwater fern  # inline comment\n')
+        self.assertEqual(code, 1)
+        self.assertEqual([entry["ok"] for entry in output], [False, True])
+        self.assertEqual(len(plant_backend.load_plants(self.path)["FERN"]["watering_history"]), 1)
+
+    def test_import_rejects_malformed_files(self):
+        for content in ([1, 2], {"X": "str"}, {"X": {"watering_history": "2024-01-01"}}):
+            other = os.path.join(self.tmp.name, "other.json")
+            with open(other, "w") as f:
+                json.dump(content, f)
+            code, output = self._run("import", other)
+            self.assertEqual((code, output["ok"]), (1, False))
+        self.assertEqual(set(plant_backend.load_plants(self.path)), {"FERN"})
+
+if __name__ == "__main__":
+    unittest.main()